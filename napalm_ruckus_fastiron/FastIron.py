@@ -18,10 +18,8 @@ from __future__ import unicode_literals
 
 # std libs
 # import sys
-from netmiko import ConnectHandler
 import socket
-import sys
-# import re
+import time
 
 # local modules
 # import napalm.base.exceptions
@@ -33,10 +31,14 @@ from napalm.base.exceptions import ReplaceConfigException, \
 # from napalm.base import validate
 from napalm.base import NetworkDriver
 
+from napalm_ruckus_fastiron import parsers
+
 
 class FastIronDriver(NetworkDriver):
     """Napalm driver for FastIron."""
 
+    PortSpeedException = parsers.PortSpeedException
+
     def __init__(self, hostname, username, password, timeout=60, optional_args=None):
         """Constructor."""
 
@@ -56,6 +58,15 @@ class FastIronDriver(NetworkDriver):
         self.config_merge = None
         self.rollback_cfg = optional_args.get('rollback_cfg', 'rollback_config.txt')
         self.image_type = None
+        self.running_config_ttl = optional_args.get('running_config_ttl', 0)
+        self._running_config = None             # (fetched at, lines) reused for the ttl
+        self._compare_cache = dict()            # (mode, running hash, candidate hash) -> diff
+        self.profile_dir = optional_args.get('profile_dir')
+        self._host_locator = None               # see utils.hosts.locate_hosts
+
+        if self.profile_dir:                    # opt-in, see utils.profiling
+            from napalm_ruckus_fastiron.utils.profiling import profile_getters
+            profile_getters(self, self.profile_dir)
 
     def __del__(self):
         """
@@ -70,14 +81,7 @@ class FastIronDriver(NetworkDriver):
         Opens a connection to the device.
         """
         try:
-            self.device = ConnectHandler(device_type='ruckus_fastiron',
-                                         ip=self.hostname,      # saves device parameters
-                                         port=self.port,
-                                         username=self.username,
-                                         password=self.password,
-                                         timeout=self.timeout,
-                                         verbose=True)
-            self.device.session_preparation()
+            self.device = self._new_session()
             # image_type = self.device.send_command("show version")   # find the image type
             # if image_type.find("SPS") != -1:
             #     self.image_type = "Switch"
@@ -88,10 +92,29 @@ class FastIronDriver(NetworkDriver):
             raise ConnectionException("Cannot connect to switch: %s:%s" % (self.hostname,
                                                                            self.port))
 
+    def _new_session(self):
+        """
+        Opens a new SSH session to the device with the parameters of the driver. Used by open()
+        and by the helpers that need an extra channel to run commands concurrently.
+        """
+        from netmiko import ConnectHandler      # deferred, parse-only users never need SSH
+
+        session = ConnectHandler(device_type='ruckus_fastiron',
+                                 ip=self.hostname,      # saves device parameters
+                                 port=self.port,
+                                 username=self.username,
+                                 password=self.password,
+                                 timeout=self.timeout,
+                                 verbose=True)
+        session.session_preparation()
+        return session
+
     def close(self):
         """
         Closes the connection to the device.
         """
+        if self._host_locator is not None:     # extra session of parallel fetches
+            self._host_locator.close()
         self.device.disconnect()
 
     def is_alive(self):
@@ -112,445 +135,81 @@ class FastIronDriver(NetworkDriver):
         except AttributeError:
             return {'is_alive': False}
 
-    def _send_command(self, command):
+    def _send_command(self, command, session=None, **kwargs):
         """Wrapper for self.device.send.command().
 
         If command is a list will iterate through commands until valid command.
+        If session is given (see _new_session) the command runs there instead of self.device.
+        Keyword arguments (e.g. max_loops) are passed to send_command.
         """
         output = ""
+        session = self.device if session is None else session
 
         try:
             if isinstance(command, list):
                 for cmd in command:
-                    output = self.device.send_command(cmd)
+                    output = session.send_command(cmd, **kwargs)
                     if "% Invalid" not in output:
                         break
             else:
-                output = self.device.send_command(command)
+                output = session.send_command(command, **kwargs)
             return output
         except (socket.error, EOFError) as e:
             raise ConnectionClosedException(str(e))
 
-    class PortSpeedException(Exception):
-        """Raised when port speed does not match available inputs"""
-
-        def __init_(self, arg):
-            print("unexpected speed: %s please submit bug with port speed" % arg)
-            sys.exit(1)
-
-    @staticmethod
-    def __retrieve_all_locations(long_string, word, pos):
-        """Finds a word of a long_string and returns the value in the nth position"""
-        count = 0                           # counter
-        split_string = long_string.split()  # breaks long string into string of substring
-        values = []                         # creates a list
-        for m in split_string:              # goes through substrings one by one
-            count += 1                      # increments counter
-            if m == word:                   # if substring and word match then specific value
-                values.append(split_string[count + pos])    # is added to list that is returned
-        return values
-
-    @staticmethod
-    def __find_words(output, word_list, pos_list):
-        """   """
-        dictionary = {}
-        if len(word_list) != len(pos_list):             # checks word, pos pair exist
-            return None
-
-        if len(word_list) == 0 or len(pos_list) == 0:   # returns NONE if list is empty
-            return None
+    def __running_config_lines(self):
+        """Fetches the running config, reused for running_config_ttl seconds if configured"""
+        now = time.time()
+        if self._running_config is not None and \
+                now - self._running_config[0] < self.running_config_ttl:
+            return self._running_config[1]
 
-        size = len(word_list)
-        sentence = output.split()                   # breaks long string into separate strings
+        output = self._send_command('show running-config')
+        lines = parsers.creates_list_of_nlines(output)
+        self._running_config = (now, lines)
+        return lines
 
-        for m in range(0, size):                    # Iterates through size of word list
-            pos = int(pos_list.pop())               # pops element position and word pair in list
-            word = word_list.pop()
-            if word in sentence:                    # checks if word is contained in text
-                indx = sentence.index(word)         # records the index of word
-                dictionary[word] = sentence[indx + pos]
+    def _clear_compare_cache(self):
+        """Drops the cached diffs and running config, after the device config changed."""
+        self._compare_cache.clear()
+        self._running_config = None
 
-        return dictionary
-
-    @staticmethod
-    def __creates_list_of_nlines(my_string):
-        """ Breaks a long string into separated substring"""
-        temp = ""                       # sets empty string, will add char respectively
-        my_list = list()                # creates list
-        for val in range(0, len(my_string)):    # iterates through the length of input
-
-            if my_string[val] == '\n' and temp == "":
-                continue
-            elif my_string[val] == '\n' or val == len(my_string) - 1:    # add what was found
-                my_list.append(temp)
-                temp = ""
-            else:
-                temp += my_string[val]
-
-        return my_list
-
-    @staticmethod
-    def __delete_if_contains(nline_list, del_word):
-        temp_list = list()                          # Creates a list to store variables
-        for a_string in nline_list:                 # iterates through list
-            if del_word in a_string:                # if word matches, word is skipped
-                continue
-            else:
-                temp_list.append(a_string.split())  # Word didn't match store in list
-        return temp_list
-
-    @staticmethod
-    def __facts_uptime(my_string):  # TODO check for hours its missing....
-        my_list = ["day(s)", "hour(s)", "minute(s)", "second(s)"]   # list of words to find
-        my_pos = [-1, -1, -1, -1]                   # relative position of interest
-        total_seconds = 0                           # data variables
-        multiplier = 0
-        t_dictionary = FastIronDriver.__find_words(my_string, my_list, my_pos)    # retrieves pos
-
-        for m in t_dictionary.keys():               # Checks word found and its multiplier
-            if m == "second(s)":                    # converts to seconds
-                multiplier = 1
-            elif m == "minute(s)":
-                multiplier = 60
-            elif m == "hour(s)":
-                multiplier = 3600
-            elif m == "day(s)":
-                multiplier = 86400
-            total_seconds = int(t_dictionary.get(m))*multiplier + total_seconds
-        return total_seconds
-
-    @staticmethod
-    def __facts_model(string):
-        model = FastIronDriver.__retrieve_all_locations(string, "Stackable", 0)[0]
-        return model                                # returns the model of the switch
-
-    @staticmethod
-    def __facts_hostname(string):
-        if "hostname" in string:
-            hostname = FastIronDriver.__retrieve_all_locations(string, "hostname", 0)[0]
-            return hostname                         # returns the hostname if configured
+    def compare_config(self):
+        """
+        Returns a string showing the difference between the running configuration and the
+        candidate configuration. The running_config is loaded automatically just before doing
+        the comparison so there is no need for you to do it.
+
+        Diffs are cached by the hashes of the running and candidate configurations, so repeated
+        comparisons of unchanged configurations skip the block diff. With the optional argument
+        running_config_ttl the running config itself is only fetched again after that many
+        seconds.
+        """
+        if self.replace_config:
+            candidate, merge = self.config_replace, False
+        elif self.merge_config:
+            candidate, merge = self.config_merge, True
         else:
-            return None
-
-    @staticmethod
-    def __facts_os_version(string):
-        os_version = FastIronDriver.__retrieve_all_locations(string, "SW:", 1)[0]
-        return os_version                           # returns the os_version of switch
-
-    @staticmethod
-    def __facts_serial(string):
-        serial = FastIronDriver.__retrieve_all_locations(string, "Serial", 0)[0]
-        serial = serial.replace('#:', '')
-        return serial                               # returns serial number
-
-    @staticmethod
-    def __physical_interface_list(shw_int_brief, only_physical=True):
-        interface_list = list()
-        n_line_output = FastIronDriver.__creates_list_of_nlines(shw_int_brief)
-
-        for line in n_line_output:
-            line_list = line.split()
-            if only_physical == 1:
-                interface_list.append(line_list[0])
-        return interface_list
-
-    @staticmethod
-    def __facts_interface_list(shw_int_brief, pos=0, del_word="Port", trigger=0):
-        interfaces_list = list()
-        n_line_output = FastIronDriver.__creates_list_of_nlines(shw_int_brief)
-
-        interface_details = FastIronDriver.__delete_if_contains(n_line_output, del_word)
-
-        for port_det in interface_details:
-
-            if trigger == 0:
-                interfaces_list.append(port_det[pos])
-            else:                                           # removes non physical interface
-                if any(x in port_det[pos] for x in ["ve", "lb", "tunnel"]):
-                    continue
-                else:
-                    interfaces_list.append(port_det[pos])       # adds phys interface to list
-        return interfaces_list
-
-    @staticmethod
-    def __port_time(shw_int_port):
-        t_port = list()                                         # Creates n lines of show int port
-        new_lines = FastIronDriver.__creates_list_of_nlines(shw_int_port)
-
-        for val in new_lines:
-            if "name" in val:
-                continue
-            t_port.append(FastIronDriver.__facts_uptime(val))     # adds time to ports
-
-        return t_port
-
-    @staticmethod
-    def __get_interface_speed(shw_int_speed):
-        speed = list()                                          # creates list
-        for val in shw_int_speed:                               # speed words contained and compared
-            if val == 'auto,' or val == '1Gbit,':               # appends speed hat
-                speed.append(1000)
-            elif val == '10Mbit,':
-                speed.append(10)
-            elif val == '100Mbit,':
-                speed.append(100)
-            elif val == '2.5Gbit,':
-                speed.append(2500)
-            elif val == '5Gbit,':
-                speed.append(5000)
-            elif val == '10Gbit,':
-                speed.append(10000)
-            elif val == '40Gbit,':
-                speed.append(40000)
-            elif val == '100Gbit,':
-                speed.append(100000)
-            else:
-                raise FastIronDriver.PortSpeedException(val)
-
-        return speed
-
-    @staticmethod
-    def __unite_strings(output):
-        """ removes all the new line and excess spacing in a string"""
-        my_string = ""                              # empty string
-
-        for index in range(len(output)):            # iterates through all characters of output
+            return ""
 
-            if output[index] != '\n' and output[index] != ' ':  # skips newline and spaces
-                my_string += output[index]
+        running = self.__running_config_lines()
+        key = (merge, parsers.config_hash(running), parsers.config_hash(candidate))
 
-            if index != len(output) - 1:
-                if output[index] == ' ' and output[index+1] != ' ':
-                    my_string += ' '                # next char of string is not another space
+        if key not in self._compare_cache:
+            if len(self._compare_cache) >= 16:     # old candidates are not compared again
+                self._compare_cache.clear()
+            self._compare_cache[key] = parsers.config_diff(running, candidate, merge)
+        return self._compare_cache[key]
 
-        return my_string                            # returns stored string
-
-    @staticmethod
-    def __get_interface_name(shw_int_name, size):
-        port_status = list()                            # Creates list
-        shw_int_name = FastIronDriver.__creates_list_of_nlines(shw_int_name)
-        for val in shw_int_name:                        # iterates through n lines
-            if "No port name" in val:
-                port_status.append("")                  # appends nothing for port name
-            else:
-                port_status.append(val.replace("Port name is", ""))     # Removes fluff add name
-
-        for temp in range(0, size - len(port_status)):  # adds no names to the remainder so that
-            port_status.append("")                      # all matrix of data are the same size
-
-        return port_status
-
-    @staticmethod
-    def __is_greater(value, threshold):               # compares two values returns true if value
-        if float(value) >= float(threshold):        # is greater or equal to threshold
-            return True
-        return False
-
-    @staticmethod
-    def __get_interfaces_speed(shw_int_speed, size):
-        port_status = list()                            # Create a list
-        for val in range(0, size):
-            if val < len(shw_int_speed):
-                port_status.append(shw_int_speed[val])  # appends string index into port list
-            else:
-                port_status.append(0)
-        return port_status                              # returns port list
-
-    @staticmethod
-    def __matrix_format(my_input):
-        my_list = list()
-        newline = FastIronDriver.__creates_list_of_nlines(my_input)
-        for text in newline:                            # Goes through n lines by n lines
-            text = text.split()                         # splits long string into words
-            if len(text) < 1:                           # if more than a single word skip
-                continue
-            else:
-                my_list.append(text)                    # appends single word
-
-        return my_list                                  # returns list
-
-    @staticmethod
-    def __environment_temperature(string):
-        dic = dict()
-        temp = FastIronDriver.__retrieve_all_locations(string, "(Sensor", -3)
-        warning = FastIronDriver.__retrieve_all_locations(string, "Warning", 1)
-        shutdown = FastIronDriver.__retrieve_all_locations(string, "Shutdown", 1)
-        for val in range(0, len(temp)):
-            crit = FastIronDriver.__is_greater(temp[val], shutdown[0])
-            alert = FastIronDriver.__is_greater(temp[val], warning[0])
-            dic.update({'sensor ' + str(val + 1): {'temperature': float(temp[val]),
-                                                   'is_alert': alert,
-                                                   'is_critical': crit}})
-
-        return {'temperature': dic}                     # returns temperature of type dictionary
-
-    @staticmethod
-    def __environment_cpu(string):
-        cpu = max(FastIronDriver.__retrieve_all_locations(string, "percent", -2))
-        dic = {'%usage': cpu}
-        return {'cpu': dic}                             # returns dictionary with key cpu
-
-    @staticmethod
-    def __environment_power(chassis_string, inline_string):
-        status = FastIronDriver.__retrieve_all_locations(chassis_string, "Power", 4)
-        potential_values = FastIronDriver.__retrieve_all_locations(chassis_string, "Power", 1)
-        norm_stat = FastIronDriver.__retrieve_all_locations(chassis_string, "Power", 7)
-        capacity = float(FastIronDriver.__retrieve_all_locations(inline_string,
-                                                                 "Free", -4)[0]) / 1000
-        pwr_used = capacity - float(FastIronDriver.__retrieve_all_locations(inline_string,
-                                                                            "Free", 1)[0]) / 1000
-
-        my_dic = {}  # creates new list
-        for val in range(0, len(status)):               # if power supply has failed will return
-            if status[val] == 'failed':                 # false, if working will return true
-                my_dic["PSU" + potential_values[val]] = {'status': False,
-                                                         'capacity': 0.0,
-                                                         'output': 0.0}
-            elif norm_stat[val] == "ok":
-                my_dic["PS" + potential_values[val]] = {'status': True,
-                                                        'capacity': capacity,
-                                                        'output': pwr_used}
-
-        return {'power': my_dic}                        # returns dictionary containing pwr info
-
-    @staticmethod
-    def __environment_fan(string):
-        fan = FastIronDriver.__retrieve_all_locations(string, "Fan", 1)
-        unit = FastIronDriver.__retrieve_all_locations(string, "Fan", 0)
-        my_dict = {}  # creates list
-
-        if "Fanless" in string:
-            return {"fan": {None}}                      # no fans are in unit and returns None
-
-        for val in range(0, len(fan)):
-            if fan[val] == "ok,":                       # checks if output is failed or ok
-                my_dict["fan" + unit[val]] = {'status': True}
-            elif fan[val] == "failed":                  # if fan fails, will return false
-                my_dict["fan" + unit[val]] = {'status': False}
-
-        return {'fan': my_dict}                         # returns dictionary containing fan info
-
-    @staticmethod
-    def __environment_memory(string):
-        mem_total = FastIronDriver.__retrieve_all_locations(string, "Dynamic", 1)
-        mem_used = FastIronDriver.__retrieve_all_locations(string, "Dynamic", 4)
-        dic = {'available_ram': int(mem_total[0]), 'used_ram': int(mem_used[0])}
-
-        return {'memory': dic}
-
-    @staticmethod
-    def __output_parser(output, word):
-        """If the word is found in the output, it will return the ip
-            address until a new interface is found."""
-        token = output.find(word) + len(word)           # saves pos of where word is contained
-        count = 0                                       # counter variable
-        output = output[token:len(output)].replace('/', ' ')
-        nline = FastIronDriver.__creates_list_of_nlines(output)
-        ip6_dict = dict()                               # creates dictionary
-
-        for sentence in nline:                          # separated n lines goes n line by n line
-            sentence = sentence.split()                 # sentence contains list of words
-
-            if len(sentence) > 2:                       # if length of list is greater than 2
-                count += 1                              # its a parent interface
-                if count > 1:                           # only a single parent interface at a time
-                    break                               # breaks if another parent interface found
-                ip6_dict.update({                       # Update ipv6 dict with ipv6 add and mask
-                        sentence[2]: {'prefix_length': sentence[3]}
-                })
-            if len(sentence) == 2:                      # child ipv6 interface is found
-                ip6_dict.update({                       # updates dictionary with ipv6 and mask
-                        sentence[0]: {'prefix_length': sentence[1]}
-                })
-
-        return ip6_dict                                 # returns ipv6 dictionary
-
-    @staticmethod
-    def __creates_config_block(list_1):
-        config_block = list()
-        temp_block = list()
-
-        for line_cmd in list_1:
-            cmd_position = list_1.index(line_cmd)
-            if cmd_position != 0:
-                if list_1[cmd_position - 1] == '!':
-                    while list_1[cmd_position] != '!' and cmd_position < len(list_1) - 1:
-                        temp_block.append(list_1[cmd_position])
-                        cmd_position += 1
-
-                    if len(temp_block) > 0:
-                        config_block.append(temp_block)
-                    temp_block = list()
-
-        return config_block
-
-    @staticmethod
-    def __compare_blocks(cb_1, config_blocks_2, cmd, symbol):
-        temp_list = list()
-        for cb_2 in config_blocks_2:                # grabs a single config block
-            if cmd == cb_2[0]:                      # checks cmd not found
-                stat = True
-                for single_cmd in cb_1:             # iterates through cmd of config block
-                    if single_cmd == cmd:           # if this is first command add as base
-                        temp_list.append(single_cmd)  # add to list with no changes
-                    elif single_cmd not in cb_2:
-                        temp_list.append(symbol + " " + single_cmd)
-        return temp_list, stat
-
-    @staticmethod
-    def __comparing_list(list_1, list_2, symbol):
-        diff_list = list()
-        config_blocks_1 = FastIronDriver.__creates_config_block(list_1)
-        config_blocks_2 = FastIronDriver.__creates_config_block(list_2)
-
-        for cb_1 in config_blocks_1:                # Grabs a single config block
-            is_found = False
-
-            if cb_1 not in config_blocks_2:         # checks if config block already exisit
-                cmd = cb_1[0]                       # grabs first cmd of config block
-
-                temp_list, is_found = FastIronDriver.__compare_blocks(cb_1, config_blocks_2,
-                                                                      cmd, symbol)
-
-                if is_found == 0:
-                    for value in cb_1:
-                        temp_list.append(symbol + " " + value)
-
-            if len(temp_list) > 1:
-                diff_list.append(temp_list)
-
-        return diff_list
-
-    @staticmethod
-    def __compare_away(diff_1, diff_2):
-        mystring = ""
-
-        for cb_1 in diff_1:
-            mystring += cb_1[0] + '\n'
-            for cb_2 in diff_2:
-                if cb_1[0] in cb_2:
-                    for value_2 in range(1, len(cb_2)):
-                        mystring += cb_2[value_2] + '\n'
-            for input_1 in range(1, len(cb_1)):
-                mystring += cb_1[input_1] + '\n'
-
-        return mystring
-
-    @staticmethod
-    def __compare_vice(diff_2, diff_1):
-        mystring = ""
-
-        for cb_2 in diff_2:
-            found = False
-            for cb_1 in diff_1:
-                if cb_2[0] in cb_1:
-                    found = True
-
-            if found == 0:
-                for input_2 in cb_2:
-                    mystring += input_2 + '\n'
-
-        return mystring
+    def discard_config(self):
+        """
+        Discards the configuration loaded into the candidate.
+        """
+        self.config_replace = None
+        self.config_merge = None
+        self.replace_config = False
+        self.merge_config = False
+        self._clear_compare_cache()
 
     def load_replace_candidate(self, filename=None, config=None):
         """
@@ -576,7 +235,7 @@ class FastIronDriver(NetworkDriver):
             try:
                 file_content = open(filename, "r")          # attempts to open file
                 temp = file_content.read()                  # stores file content
-                self.config_replace = FastIronDriver.__creates_list_of_nlines(temp)
+                self.config_replace = parsers.creates_list_of_nlines(temp)
                 self.replace_config = True                  # file opened successfully
                 return
             except ValueError:
@@ -584,7 +243,7 @@ class FastIronDriver(NetworkDriver):
 
         if config is not None:
             try:
-                self.config_replace = FastIronDriver.__creates_list_of_nlines(config)
+                self.config_replace = parsers.creates_list_of_nlines(config)
                 self.replace_config = True                  # string successfully saved
                 return
             except ValueError:
@@ -616,7 +275,7 @@ class FastIronDriver(NetworkDriver):
             try:
                 file_content = open(filename, "r")          # attempts to open file
                 temp = file_content.read()                  # stores file content
-                self.config_merge = FastIronDriver.__creates_list_of_nlines(temp)
+                self.config_merge = parsers.creates_list_of_nlines(temp)
                 self.merge_config = True                    # file opened successfully
                 return
             except ValueError:
@@ -624,7 +283,7 @@ class FastIronDriver(NetworkDriver):
 
         if config is not None:
             try:
-                self.config_merge = FastIronDriver.__creates_list_of_nlines(config)
+                self.config_merge = parsers.creates_list_of_nlines(config)
                 self.merge_config = True                    # string successfully saved
                 return
             except ValueError:
@@ -640,31 +299,214 @@ class FastIronDriver(NetworkDriver):
             * ip (string)
             * age (float)
         """
-        output = self.device.send_command('show arp')
-        token = output.find('Status') + len('Status') + 1
-        vtoken = output.find('VLAN') + len('VLAN') + 1
+        return list(self._iter_arp_table(vrf))
 
-        if vtoken != 0:                # router version, does not contain default vlan in arp
-            token = vtoken             # defaults to switch version
+    def _iter_arp_table(self, vrf="", session=None):
+        """
+        Same as get_arp_table() but yields the entries one by one, so they can be written
+        into a result sink (see utils.sinks.stream_getter) without building the whole table.
+        """
+        return parsers.arp_table(self._send_command('show arp', session))
+
+    def get_mac_address_table(self):
+        """
+        Returns a lists of dictionaries. Each dictionary represents an entry in the MAC Address
+        Table, having the following keys:
+            * mac (string)
+            * interface (string)
+            * vlan (int)
+            * active (boolean)
+            * static (boolean)
+            * moves (int)
+            * last_move (float)
+        """
+        return list(self._iter_mac_address_table())
+
+    def _iter_mac_address_table(self, session=None):
+        """
+        Same as get_mac_address_table() but yields the entries one by one.
+        """
+        return parsers.mac_address_table(self._send_command('show mac-address all', session))
 
-        output = FastIronDriver.__creates_list_of_nlines(output[token:len(output)])
-        arp_table = list()
+    def _iter_routes(self, destination="", protocol="", session=None):
+        """
+        Yields (prefix, route) pairs as show ip route is parsed, the whole table when no
+        destination is given. Routes have the keys described in get_route_to().
+        """
+        command = 'show ip route'
+        if destination:
+            command += ' ' + destination
 
-        for val in output:
-            check = val
-            if len(check.split()) < 7:
+        output = self._send_command(command, session)
+        for prefix, route in parsers.route_entries(output):
+            if protocol and route['protocol'] != protocol.lower():
                 continue
+            yield prefix, route
 
-            if vtoken == 0:
-                __, ip, mac, __, age, interface, __ = val.split()
-            else:
-                __, ip, mac, __, age, interface, __, vlan = val.split()
+    def get_route_to(self, destination="", protocol=""):
+        """
+        Returns a dictionary of dictionaries containing details of all available routes to a
+        destination.
+
+        :param destination: The destination prefix to be used when filtering the routes.
+        :param protocol (optional): Retrieve the routes only for a specific protocol.
+
+        Each inner dictionary contains the following fields:
+            * protocol (string)
+            * current_active (True/False)
+            * last_active (True/False)
+            * age (int)
+            * next_hop (string)
+            * outgoing_interface (string)
+            * selected_next_hop (True/False)
+            * preference (int)
+            * inactive_reason (string)
+            * routing_table (string)
+            * protocol_attributes (dictionary)
+
+        For many lookups against the same device see utils.routes.RouteTable, which loads the
+        table once and answers longest prefix matches locally.
+        """
+        routes = dict()
+        for prefix, route in self._iter_routes(destination, protocol):
+            routes.setdefault(prefix, list()).append(route)
+        return routes
+
+    def _ping(self, destination, source="", ttl=255, timeout=2, size=100, count=5, vrf="",
+              session=None):
+        """Same as ping(), on session when given (see _new_session)."""
+        command = 'ping vrf %s %s' % (vrf, destination) if vrf else 'ping %s' % destination
+        command += ' count %s timeout %s ttl %s size %s' % (count, int(timeout * 1000), ttl, size)
+        if source:
+            command += ' source %s' % source
+
+        max_loops = 5 * count * timeout + 150       # netmiko reads every 0.2s, 100s by default
+        return parsers.ping_results(
+            self._send_command(command, session, max_loops=int(max_loops)), count)
+
+    def ping(self, destination, source="", ttl=255, timeout=2, size=100, count=5, vrf=""):
+        """
+        Executes ping on the device and returns a dictionary with the result
+
+        :param destination: Host or IP Address of the destination
+        :param source (optional): Source address of echo request
+        :param ttl (optional): Maximum number of hops
+        :param timeout (optional): Maximum seconds to wait after sending final packet
+        :param size (optional): Size of request (bytes)
+        :param count (optional): Number of ping request to send
+        :param vrf (optional): VRF to source the echo request from
+
+        Output dictionary has one of following keys:
+            * success
+            * error
+
+        In case of success, inner dictionary will have the following keys:
+            * probes_sent (int)
+            * packet_loss (int)
+            * rtt_min (float)
+            * rtt_max (float)
+            * rtt_avg (float)
+            * rtt_stddev (float)
+            * results (list)
+
+        'results' is a list of dictionaries with the following keys:
+            * ip_address (str)
+            * rtt (float)
+
+        To ping many destinations concurrently see utils.reachability.ping_many.
+        """
+        return self._ping(destination, source, ttl, timeout, size, count, vrf)
 
-            arp_table.append({
-                'interface': interface,
-                'mac': mac,
-                'ip': ip,
-                'age': float(age),
-            })
+    def _traceroute(self, destination, source="", ttl=255, timeout=2, vrf="", session=None):
+        """Same as traceroute(), on session when given (see _new_session)."""
+        command = 'traceroute vrf %s %s' % (vrf, destination) if vrf \
+            else 'traceroute %s' % destination
+        command += ' maxttl %s timeout %s' % (ttl, timeout)
+        if source:
+            command += ' source %s' % source
 
-        return arp_table
+        max_loops = 5 * ttl * timeout + 150         # an unreachable host times out every hop
+        return parsers.traceroute_results(
+            self._send_command(command, session, max_loops=int(max_loops)))
+
+    def traceroute(self, destination, source="", ttl=255, timeout=2, vrf=""):
+        """
+        Executes traceroute on the device and returns a dictionary with the result.
+
+        :param destination: Host or IP Address of the destination
+        :param source (optional): Use a specific IP Address to execute the traceroute
+        :param ttl (optional): Maximum number of hops
+        :param timeout (optional): Number of seconds to wait for response
+        :param vrf (optional): VRF to source the traceroute from
+
+        Output dictionary has one of the following keys:
+            * success
+            * error
+
+        In case of success, the keys of the dictionary represent the hop ID, while values are
+        dictionaries containing the probes results:
+            * rtt (float)
+            * ip_address (str)
+            * host_name (str)
+        """
+        return self._traceroute(destination, source, ttl, timeout, vrf)
+
+    def get_optics(self):
+        """
+        Fetches the power usage on the various transceivers installed on the switch (in dbm),
+        and returns a view that conforms with the openconfig model
+        openconfig-platform-transceiver.yang
+
+        Returns a dictionary where the keys are as listed below:
+            * intf_name (unicode)
+                * physical_channels
+                    * channels (list of dicts)
+                        * index (int)
+                        * state
+                            * input_power
+                                * instant (float)
+                                * avg (float)
+                                * min (float)
+                                * max (float)
+                            * output_power
+                                * instant (float)
+                                * avg (float)
+                                * min (float)
+                                * max (float)
+                            * laser_bias_current
+                                * instant (float)
+                                * avg (float)
+                                * min (float)
+                                * max (float)
+
+        The whole stack is read with a single show optic command, only instant values are
+        reported by FastIron.
+        """
+        output = self._send_command(['show optic all', 'show optic'])
+        return dict(parsers.optics_entries(output))
+
+    def get_lldp_neighbors_detail(self, interface=""):
+        """
+        Returns a detailed view of the LLDP neighbors as a dictionary
+        containing lists of dictionaries for each interface.
+
+        Inner dictionaries contain fields:
+            * parent_interface (string)
+            * remote_port (string)
+            * remote_port_description (string)
+            * remote_chassis_id (string)
+            * remote_system_name (string)
+            * remote_system_description (string)
+            * remote_system_capab (list)
+            * remote_system_enable_capab (list)
+
+        The whole stack is read with a single show lldp neighbors detail command, also when
+        interface is given.
+        """
+        output = self._send_command('show lldp neighbors detail')
+        neighbors = dict()
+        for port, neighbor in parsers.lldp_entries(output):
+            if interface and port != interface:
+                continue
+            neighbors.setdefault(port, list()).append(neighbor)
+        return neighbors
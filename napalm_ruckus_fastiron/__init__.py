@@ -12,13 +12,53 @@
 # License for the specific language governing permissions and limitations under
 # the License.
 
-"""napalm-ruckus-fastiron package."""
-import pkg_resources
-from napalm_ruckus_fastiron.FastIron import FastIronDriver
+"""napalm-ruckus-fastiron package.
 
-try:
-    __version__ = pkg_resources.get_distribution('napalm-ruckus-fastiron').version
-except pkg_resources.DistributionNotFound:
-    __version__ = "Not installed"
+The driver (and with it napalm, netmiko and paramiko) and the package version are loaded on
+first access, so importing the package stays cheap for processes that never open a session.
+Saved outputs can be parsed offline with napalm_ruckus_fastiron.parsers, which imports neither.
+"""
+import sys
+import types
 
 __all__ = ["FastIronDriver"]
+
+
+def _get_version():
+    import pkg_resources
+    try:
+        return pkg_resources.get_distribution('napalm-ruckus-fastiron').version
+    except pkg_resources.DistributionNotFound:
+        return "Not installed"
+
+
+class _LazyPackage(types.ModuleType):
+    """Package module resolving FastIronDriver and __version__ on first access.
+
+    A module subclass rather than a module level __getattr__ (PEP 562), which only exists
+    from Python 3.7 on.
+    """
+
+    def __getattr__(self, name):
+        if name == "FastIronDriver":
+            from napalm_ruckus_fastiron.FastIron import FastIronDriver
+            value = FastIronDriver
+        elif name == "__version__":
+            value = _get_version()
+        else:
+            raise AttributeError("module %r has no attribute %r" % (self.__name__, name))
+
+        setattr(self, name, value)          # cache, next lookup skips __getattr__
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(__all__) | {"__version__"})
+
+
+if sys.version_info >= (3, 5):
+    sys.modules[__name__].__class__ = _LazyPackage
+else:                                       # module classes can not be assigned, swap it
+    _package = _LazyPackage(__name__, __doc__)
+    _package.__dict__.update(sys.modules[__name__].__dict__)
+    _package._module = sys.modules[__name__]   # python 2 clears globals of collected modules
+    sys.modules[__name__] = _package
@@ -0,0 +1,668 @@
+"""FastIron output parsers.
+
+Pure functions turning the text of show commands into napalm structures. The module does not
+import napalm or netmiko, so saved outputs can be parsed offline without the SSH stack:
+
+    from napalm_ruckus_fastiron import parsers
+    arp_table = list(parsers.arp_table(open('show_arp.txt').read()))
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import hashlib
+import io
+import re
+import sys
+
+
+ROUTE_LINE = re.compile(r'^\s*(?:\d+\s+)?'                    # entry, none on ECMP paths
+                        r'(?P<dest>[0-9a-fA-F.:]+)(?:/(?P<length>\d+)|\s+(?P<mask>[0-9.]+))\s+'
+                        r'(?P<gateway>\S+)\s+(?P<port>.+?)\s+'
+                        r'(?P<distance>\d+)/(?P<metric>\d+)\s+(?P<type>\S+)'
+                        r'(?:\s+(?P<uptime>\S+))?')
+ROUTE_PROTOCOLS = {'B': 'bgp', 'D': 'connected', 'S': 'static', 'O': 'ospf', 'R': 'rip',
+                   'I': 'isis'}
+PING_REPLY = re.compile(r'Reply from (?P<ip>\S+)\s*:.*time\s*[=<]\s*(?P<rtt>\d+)\s*ms')
+PING_SUMMARY = re.compile(r'Success rate is \d+ percent \((?P<received>\d+)/(?P<sent>\d+)\)')
+TRACE_HOP = re.compile(r'^\s*(?P<hop>\d+)\s+(?P<probes>.*?)\s*(?P<ip>\S+)\s*$')
+TRACE_PROBE = re.compile(r'<?(\d+)\s*ms|\*')
+OPTIC_LINE = re.compile(r'^\s*(?P<port>\d+/\d+/\d+)\s+\S+\s*C\s+'
+                        r'(?P<tx>-?[\d.]+)\s*dBm\s+(?P<rx>-?[\d.]+)\s*dBm\s+'
+                        r'(?P<bias>[\d.]+)\s*mA')
+CONFIG_FRAMING = ('', '!', 'Current configuration:', 'end')
+LLDP_FIELDS = {'Chassis ID': 'remote_chassis_id', 'Port ID': 'remote_port',
+               'Port description': 'remote_port_description',
+               'System name': 'remote_system_name',
+               'System description': 'remote_system_description',
+               'System capabilities': 'remote_system_capab',
+               'Enabled capabilities': 'remote_system_enable_capab'}
+
+
+class PortSpeedException(Exception):
+    """Raised when port speed does not match available inputs"""
+
+    def __init_(self, arg):
+        print("unexpected speed: %s please submit bug with port speed" % arg)
+        sys.exit(1)
+
+
+def retrieve_all_locations(long_string, word, pos):
+    """Finds a word of a long_string and returns the value in the nth position"""
+    count = 0                           # counter
+    split_string = long_string.split()  # breaks long string into string of substring
+    values = []                         # creates a list
+    for m in split_string:              # goes through substrings one by one
+        count += 1                      # increments counter
+        if m == word:                   # if substring and word match then specific value
+            values.append(split_string[count + pos])    # is added to list that is returned
+    return values
+
+
+def find_words(output, word_list, pos_list):
+    """   """
+    dictionary = {}
+    if len(word_list) != len(pos_list):             # checks word, pos pair exist
+        return None
+
+    if len(word_list) == 0 or len(pos_list) == 0:   # returns NONE if list is empty
+        return None
+
+    size = len(word_list)
+    sentence = output.split()                   # breaks long string into separate strings
+
+    for m in range(0, size):                    # Iterates through size of word list
+        pos = int(pos_list.pop())               # pops element position and word pair in list
+        word = word_list.pop()
+        if word in sentence:                    # checks if word is contained in text
+            indx = sentence.index(word)         # records the index of word
+            dictionary[word] = sentence[indx + pos]
+
+    return dictionary
+
+
+def creates_list_of_nlines(my_string):
+    """ Breaks a long string into its non empty lines, with or without a trailing newline"""
+    return [line for line in my_string.splitlines() if line]
+
+
+def delete_if_contains(nline_list, del_word):
+    temp_list = list()                          # Creates a list to store variables
+    for a_string in nline_list:                 # iterates through list
+        if del_word in a_string:                # if word matches, word is skipped
+            continue
+        else:
+            temp_list.append(a_string.split())  # Word didn't match store in list
+    return temp_list
+
+
+def facts_uptime(my_string):  # TODO check for hours its missing....
+    my_list = ["day(s)", "hour(s)", "minute(s)", "second(s)"]   # list of words to find
+    my_pos = [-1, -1, -1, -1]                   # relative position of interest
+    total_seconds = 0                           # data variables
+    multiplier = 0
+    t_dictionary = find_words(my_string, my_list, my_pos)    # retrieves pos
+
+    for m in t_dictionary.keys():               # Checks word found and its multiplier
+        if m == "second(s)":                    # converts to seconds
+            multiplier = 1
+        elif m == "minute(s)":
+            multiplier = 60
+        elif m == "hour(s)":
+            multiplier = 3600
+        elif m == "day(s)":
+            multiplier = 86400
+        total_seconds = int(t_dictionary.get(m))*multiplier + total_seconds
+    return total_seconds
+
+
+def facts_model(string):
+    model = retrieve_all_locations(string, "Stackable", 0)[0]
+    return model                                # returns the model of the switch
+
+
+def facts_hostname(string):
+    if "hostname" in string:
+        hostname = retrieve_all_locations(string, "hostname", 0)[0]
+        return hostname                         # returns the hostname if configured
+    else:
+        return None
+
+
+def facts_os_version(string):
+    os_version = retrieve_all_locations(string, "SW:", 1)[0]
+    return os_version                           # returns the os_version of switch
+
+
+def facts_serial(string):
+    serial = retrieve_all_locations(string, "Serial", 0)[0]
+    serial = serial.replace('#:', '')
+    return serial                               # returns serial number
+
+
+def physical_interface_list(shw_int_brief, only_physical=True):
+    interface_list = list()
+    n_line_output = creates_list_of_nlines(shw_int_brief)
+
+    for line in n_line_output:
+        line_list = line.split()
+        if only_physical == 1:
+            interface_list.append(line_list[0])
+    return interface_list
+
+
+def facts_interface_list(shw_int_brief, pos=0, del_word="Port", trigger=0):
+    interfaces_list = list()
+    n_line_output = creates_list_of_nlines(shw_int_brief)
+
+    interface_details = delete_if_contains(n_line_output, del_word)
+
+    for port_det in interface_details:
+        port = interface_name(port_det[pos])
+
+        if trigger == 0:
+            interfaces_list.append(port)
+        else:                                           # removes non physical interface
+            if any(x in port for x in ["ve", "lb", "tunnel"]):
+                continue
+            else:
+                interfaces_list.append(port)            # adds phys interface to list
+    return interfaces_list
+
+
+def interface_name(name):
+    """Returns the interned copy of an interface name, large stacks repeat them a lot"""
+    try:
+        return sys.intern(name)
+    except (AttributeError, TypeError):     # python 2 only interns byte strings
+        return name
+
+
+def port_time(shw_int_port):
+    t_port = list()                                         # Creates n lines of show int port
+    new_lines = creates_list_of_nlines(shw_int_port)
+
+    for val in new_lines:
+        if "name" in val:
+            continue
+        t_port.append(facts_uptime(val))     # adds time to ports
+
+    return t_port
+
+
+def get_interface_speed(shw_int_speed):
+    speed = list()                                          # creates list
+    for val in shw_int_speed:                               # speed words contained and compared
+        if val == 'auto,' or val == '1Gbit,':               # appends speed hat
+            speed.append(1000)
+        elif val == '10Mbit,':
+            speed.append(10)
+        elif val == '100Mbit,':
+            speed.append(100)
+        elif val == '2.5Gbit,':
+            speed.append(2500)
+        elif val == '5Gbit,':
+            speed.append(5000)
+        elif val == '10Gbit,':
+            speed.append(10000)
+        elif val == '40Gbit,':
+            speed.append(40000)
+        elif val == '100Gbit,':
+            speed.append(100000)
+        else:
+            raise PortSpeedException(val)
+
+    return speed
+
+
+def unite_strings(output):
+    """ removes all the new line and excess spacing in a string"""
+    my_string = ""                              # empty string
+
+    for index in range(len(output)):            # iterates through all characters of output
+
+        if output[index] != '\n' and output[index] != ' ':  # skips newline and spaces
+            my_string += output[index]
+
+        if index != len(output) - 1:
+            if output[index] == ' ' and output[index+1] != ' ':
+                my_string += ' '                # next char of string is not another space
+
+    return my_string                            # returns stored string
+
+
+def get_interface_name(shw_int_name, size):
+    port_status = list()                            # Creates list
+    shw_int_name = creates_list_of_nlines(shw_int_name)
+    for val in shw_int_name:                        # iterates through n lines
+        if "No port name" in val:
+            port_status.append("")                  # appends nothing for port name
+        else:
+            port_status.append(val.replace("Port name is", ""))     # Removes fluff add name
+
+    for temp in range(0, size - len(port_status)):  # adds no names to the remainder so that
+        port_status.append("")                      # all matrix of data are the same size
+
+    return port_status
+
+
+def is_greater(value, threshold):               # compares two values returns true if value
+    if float(value) >= float(threshold):        # is greater or equal to threshold
+        return True
+    return False
+
+
+def get_interfaces_speed(shw_int_speed, size):
+    port_status = list()                            # Create a list
+    for val in range(0, size):
+        if val < len(shw_int_speed):
+            port_status.append(shw_int_speed[val])  # appends string index into port list
+        else:
+            port_status.append(0)
+    return port_status                              # returns port list
+
+
+def matrix_format(my_input):
+    my_list = list()
+    newline = creates_list_of_nlines(my_input)
+    for text in newline:                            # Goes through n lines by n lines
+        text = text.split()                         # splits long string into words
+        if len(text) < 1:                           # if more than a single word skip
+            continue
+        else:
+            my_list.append(text)                    # appends single word
+
+    return my_list                                  # returns list
+
+
+def environment_temperature(string):
+    dic = dict()
+    temp = retrieve_all_locations(string, "(Sensor", -3)
+    warning = retrieve_all_locations(string, "Warning", 1)
+    shutdown = retrieve_all_locations(string, "Shutdown", 1)
+    for val in range(0, len(temp)):
+        crit = is_greater(temp[val], shutdown[0])
+        alert = is_greater(temp[val], warning[0])
+        dic.update({'sensor ' + str(val + 1): {'temperature': float(temp[val]),
+                                               'is_alert': alert,
+                                               'is_critical': crit}})
+
+    return {'temperature': dic}                     # returns temperature of type dictionary
+
+
+def environment_cpu(string):
+    cpu = max(retrieve_all_locations(string, "percent", -2))
+    dic = {'%usage': cpu}
+    return {'cpu': dic}                             # returns dictionary with key cpu
+
+
+def environment_power(chassis_string, inline_string):
+    status = retrieve_all_locations(chassis_string, "Power", 4)
+    potential_values = retrieve_all_locations(chassis_string, "Power", 1)
+    norm_stat = retrieve_all_locations(chassis_string, "Power", 7)
+    capacity = float(retrieve_all_locations(inline_string, "Free", -4)[0]) / 1000
+    pwr_used = capacity - float(retrieve_all_locations(inline_string, "Free", 1)[0]) / 1000
+
+    my_dic = {}  # creates new list
+    for val in range(0, len(status)):               # if power supply has failed will return
+        if status[val] == 'failed':                 # false, if working will return true
+            my_dic["PSU" + potential_values[val]] = {'status': False,
+                                                     'capacity': 0.0,
+                                                     'output': 0.0}
+        elif norm_stat[val] == "ok":
+            my_dic["PS" + potential_values[val]] = {'status': True,
+                                                    'capacity': capacity,
+                                                    'output': pwr_used}
+
+    return {'power': my_dic}                        # returns dictionary containing pwr info
+
+
+def environment_fan(string):
+    fan = retrieve_all_locations(string, "Fan", 1)
+    unit = retrieve_all_locations(string, "Fan", 0)
+    my_dict = {}  # creates list
+
+    if "Fanless" in string:
+        return {"fan": {None}}                      # no fans are in unit and returns None
+
+    for val in range(0, len(fan)):
+        if fan[val] == "ok,":                       # checks if output is failed or ok
+            my_dict["fan" + unit[val]] = {'status': True}
+        elif fan[val] == "failed":                  # if fan fails, will return false
+            my_dict["fan" + unit[val]] = {'status': False}
+
+    return {'fan': my_dict}                         # returns dictionary containing fan info
+
+
+def environment_memory(string):
+    mem_total = retrieve_all_locations(string, "Dynamic", 1)
+    mem_used = retrieve_all_locations(string, "Dynamic", 4)
+    dic = {'available_ram': int(mem_total[0]), 'used_ram': int(mem_used[0])}
+
+    return {'memory': dic}
+
+
+def output_parser(output, word):
+    """If the word is found in the output, it will return the ip
+        address until a new interface is found."""
+    token = output.find(word) + len(word)           # saves pos of where word is contained
+    count = 0                                       # counter variable
+    output = output[token:len(output)].replace('/', ' ')
+    nline = creates_list_of_nlines(output)
+    ip6_dict = dict()                               # creates dictionary
+
+    for sentence in nline:                          # separated n lines goes n line by n line
+        sentence = sentence.split()                 # sentence contains list of words
+
+        if len(sentence) > 2:                       # if length of list is greater than 2
+            count += 1                              # its a parent interface
+            if count > 1:                           # only a single parent interface at a time
+                break                               # breaks if another parent interface found
+            ip6_dict.update({                       # Update ipv6 dict with ipv6 add and mask
+                    sentence[2]: {'prefix_length': sentence[3]}
+            })
+        if len(sentence) == 2:                      # child ipv6 interface is found
+            ip6_dict.update({                       # updates dictionary with ipv6 and mask
+                    sentence[0]: {'prefix_length': sentence[1]}
+            })
+
+    return ip6_dict                                 # returns ipv6 dictionary
+
+
+def creates_config_block(list_1):
+    """Splits config lines into blocks, each top level command with its indented sub commands"""
+    config_block = list()
+    temp_block = list()
+
+    for line_cmd in list_1:
+        if line_cmd.strip() in CONFIG_FRAMING:          # '!' separators, banner and 'end'
+            line_cmd = None
+        if temp_block and (line_cmd is None or not line_cmd[:1].isspace()):
+            config_block.append(temp_block)
+            temp_block = list()
+        if line_cmd:
+            temp_block.append(line_cmd)
+
+    if temp_block:
+        config_block.append(temp_block)
+    return config_block
+
+
+def compare_blocks(cb_1, config_blocks_2, cmd, symbol):
+    temp_list = list()
+    stat = False
+    for cb_2 in config_blocks_2:                # grabs a single config block
+        if cmd == cb_2[0]:                      # checks cmd not found
+            stat = True
+            for single_cmd in cb_1:             # iterates through cmd of config block
+                if single_cmd == cmd:           # if this is first command add as base
+                    temp_list.append(single_cmd)  # add to list with no changes
+                elif single_cmd not in cb_2:
+                    temp_list.append(symbol + " " + single_cmd)
+    return temp_list, stat
+
+
+def comparing_list(list_1, list_2, symbol):
+    diff_list = list()
+    config_blocks_1 = creates_config_block(list_1)
+    config_blocks_2 = creates_config_block(list_2)
+
+    for cb_1 in config_blocks_1:                # Grabs a single config block
+        is_found = False
+        temp_list = list()
+
+        if cb_1 not in config_blocks_2:         # checks if config block already exisit
+            cmd = cb_1[0]                       # grabs first cmd of config block
+
+            temp_list, is_found = compare_blocks(cb_1, config_blocks_2, cmd, symbol)
+
+            if is_found == 0:
+                for value in cb_1:
+                    temp_list.append(symbol + " " + value)
+
+        if len(temp_list) > 1 or (temp_list and not is_found):   # one line blocks too
+            diff_list.append(temp_list)
+
+    return diff_list
+
+
+def compare_away(diff_1, diff_2):
+    mystring = ""
+
+    for cb_1 in diff_1:
+        mystring += cb_1[0] + '\n'
+        for cb_2 in diff_2:
+            if cb_1[0] in cb_2:
+                for value_2 in range(1, len(cb_2)):
+                    mystring += cb_2[value_2] + '\n'
+        for input_1 in range(1, len(cb_1)):
+            mystring += cb_1[input_1] + '\n'
+
+    return mystring
+
+
+def compare_vice(diff_2, diff_1):
+    mystring = ""
+
+    for cb_2 in diff_2:
+        found = False
+        for cb_1 in diff_1:
+            if cb_2[0] in cb_1:
+                found = True
+
+        if found == 0:
+            for input_2 in cb_2:
+                mystring += input_2 + '\n'
+
+    return mystring
+
+
+def config_hash(lines):
+    return hashlib.sha1('\n'.join(lines).encode('utf-8')).hexdigest()
+
+
+def config_diff(running, candidate, merge):
+    """Block diff of the candidate against the running config, additions only on merge"""
+    diff_1 = comparing_list(candidate, running, "+")
+    if merge:
+        return compare_away(diff_1, list())
+
+    diff_2 = comparing_list(running, candidate, "-")
+    return compare_away(diff_1, diff_2) + \
+        compare_vice(diff_2, diff_1)
+
+
+def route_uptime(uptime):
+    """Converts a route uptime such as 12d2h or 5m10s into seconds"""
+    multiplier = {'d': 86400, 'h': 3600, 'm': 60, 's': 1}
+    return sum(int(value) * multiplier[unit]
+               for value, unit in re.findall(r'(\d+)([dhms])', uptime or ''))
+
+
+def route_entries(output):
+    """Parses show ip route line by line, yields (prefix, route) for every path found"""
+    for line in io.StringIO(output):            # lazily, tables can be very large
+        match = ROUTE_LINE.match(line)
+        if match is None:                       # skips headers and type codes
+            continue
+
+        length = match.group('length')
+        if length is None:                      # older images print the netmask
+            length = sum(bin(int(octet)).count('1')
+                         for octet in match.group('mask').split('.'))
+        gateway = match.group('gateway')
+
+        yield '%s/%s' % (match.group('dest'), length), {
+            'protocol': ROUTE_PROTOCOLS.get(match.group('type')[0], match.group('type')),
+            'current_active': True,             # only active routes are shown
+            'last_active': True,
+            'age': route_uptime(match.group('uptime')),
+            'next_hop': '' if gateway == 'DIRECT' else gateway,
+            'outgoing_interface': match.group('port').replace(' ', ''),
+            'selected_next_hop': True,
+            'preference': int(match.group('distance')),
+            'inactive_reason': '',
+            'routing_table': 'default',
+            'protocol_attributes': {},
+        }
+
+
+def ping_results(output, count):
+    """Parses the output of ping into the napalm ping result"""
+    if 'Unknown host' in output or '% Invalid' in output:
+        return {'error': output.strip()}
+
+    results = list()
+    for line in io.StringIO(output):
+        match = PING_REPLY.search(line)
+        if match is not None:
+            results.append({'ip_address': match.group('ip'),
+                            'rtt': float(match.group('rtt'))})
+
+    summary = PING_SUMMARY.search(output)
+    sent = int(summary.group('sent')) if summary else count
+    rtts = [result['rtt'] for result in results]
+    rtt_avg = sum(rtts) / len(rtts) if rtts else 0.0
+    rtt_stddev = (sum((rtt - rtt_avg) ** 2 for rtt in rtts) / len(rtts)) ** 0.5 \
+        if rtts else 0.0
+
+    return {'success': {
+        'probes_sent': sent,
+        'packet_loss': sent - len(results),
+        'rtt_min': min(rtts) if rtts else 0.0,
+        'rtt_max': max(rtts) if rtts else 0.0,
+        'rtt_avg': rtt_avg,
+        'rtt_stddev': rtt_stddev,
+        'results': results,
+    }}
+
+
+def traceroute_results(output):
+    """Parses the output of traceroute into the napalm traceroute result"""
+    if 'Unknown host' in output or '% Invalid' in output:
+        return {'error': output.strip()}
+
+    hops = dict()
+    for line in io.StringIO(output):
+        match = TRACE_HOP.match(line)
+        if match is None:
+            continue
+
+        address = match.group('ip')
+        if address in ('*', '?'):               # no answer on this hop
+            address = '*'
+        probes = dict()
+        fields = match.group('probes') + ' ' + match.group('ip')
+        for index, rtt in enumerate(TRACE_PROBE.findall(fields)):
+            probes[index + 1] = {
+                'rtt': float(rtt) if rtt else 0.0,
+                'ip_address': address,
+                'host_name': address,
+            }
+        hops[int(match.group('hop'))] = {'probes': probes}
+
+    return {'success': hops}
+
+
+def optics_entries(output):
+    """Parses show optic line by line, yields (port, optics) for every port with a module"""
+    for line in io.StringIO(output):
+        match = OPTIC_LINE.match(line)
+        if match is None:                       # skips headers, alarms and empty ports
+            continue
+
+        state = dict()
+        for field, group in (('input_power', 'rx'), ('output_power', 'tx'),
+                             ('laser_bias_current', 'bias')):
+            state[field] = {'instant': float(match.group(group)),
+                            'avg': 0.0, 'min': 0.0, 'max': 0.0}
+
+        yield interface_name(match.group('port')), {
+            'physical_channels': {'channel': [{'index': 0, 'state': state}]}
+        }
+
+
+def lldp_value(key, value):
+    value = value.strip()
+    if key in ('remote_system_capab', 'remote_system_enable_capab'):
+        return [capab.strip().lower() for capab in value.split(',') if capab.strip()]
+    return value.strip('"')
+
+
+def lldp_entries(output):
+    """Parses show lldp neighbors detail line by line, yields (port, neighbor)"""
+    port = None
+    neighbor = None
+    open_key = None                             # quoted value continued on the next line
+
+    for line in io.StringIO(output):
+        text = line.strip()
+        if open_key is not None:
+            neighbor[open_key] += ' ' + text.rstrip('"')
+            if text.endswith('"'):
+                open_key = None
+            continue
+
+        if text.startswith('Local port:'):
+            if neighbor is not None:
+                yield port, neighbor
+            port = interface_name(text.split(':', 1)[1].strip())
+            neighbor = None
+        elif text.startswith('Neighbor:') and port is not None:
+            if neighbor is not None:            # several neighbors on one port
+                yield port, neighbor
+            neighbor = {'parent_interface': '', 'remote_port': '',
+                        'remote_chassis_id': '', 'remote_port_description': '',
+                        'remote_system_name': '', 'remote_system_description': '',
+                        'remote_system_capab': [], 'remote_system_enable_capab': []}
+        elif neighbor is not None and ':' in text:
+            label, value = text.lstrip('+ ').split(':', 1)
+            label = label.split('(')[0].strip()     # drops (MAC address) and friends
+            key = LLDP_FIELDS.get(label)
+            if key is None:
+                continue
+            neighbor[key] = lldp_value(key, value)
+            value = value.strip()
+            if value.startswith('"') and (len(value) == 1 or not value.endswith('"')):
+                open_key = key
+
+    if neighbor is not None:
+        yield port, neighbor
+
+
+def arp_table(output):
+    """Parses show arp line by line, yields the get_arp_table() entries"""
+    for line in io.StringIO(output):            # lazily, tables can be very large
+        entry = line.split()
+        if len(entry) < 7 or not entry[0].isdigit():   # skips headers and totals
+            continue
+
+        __, ip, mac, __, age, interface = entry[:6]     # switch images add a VLAN column
+        yield {
+            'interface': interface,
+            'mac': mac,
+            'ip': ip,
+            'age': float(age),
+        }
+
+
+def mac_address_table(output):
+    """Parses show mac-address all line by line, yields the get_mac_address_table() entries"""
+    for line in io.StringIO(output):
+        entry = line.split()
+        if len(entry) < 4 or entry[0].count('.') != 2:     # skips headers and totals
+            continue
+
+        mac, interface, mac_type, vlan = entry[:4]
+        action = entry[4] if len(entry) > 4 else 'forward'
+
+        yield {
+            'mac': mac,
+            'interface': interface,
+            'vlan': int(vlan),
+            'static': mac_type == 'Static',
+            'active': action != 'block',
+            'moves': -1,                        # not tracked by FastIron
+            'last_move': -1.0,
+        }
@@ -0,0 +1,184 @@
+"""Host location, answers "which port is this IP/MAC behind" from the ARP and MAC tables."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+import time
+
+
+class HostLocator(object):
+    """Joins the ARP and MAC address tables of a FastIron driver through hash indexes.
+
+    The indexes are kept between calls, a refresh only applies the entries that were added,
+    changed or removed since the previous fetch. With parallel=True the MAC table is fetched
+    over a second SSH session while the ARP table is read on the main one.
+    """
+
+    def __init__(self, driver, max_age=60, parallel=False):
+        self.driver = driver
+        self.max_age = max_age                  # seconds before locate() refreshes the index
+        self.parallel = parallel
+        self.refreshed_at = None
+        self.by_ip = dict()                     # ip -> arp entry
+        self.by_mac = dict()                    # (mac, vlan) -> mac table entry
+        self.vlans_by_mac = dict()              # mac -> set of vlans it is learned in
+        self.ips_by_mac = dict()                # mac -> set of ips learned through arp
+        self._session = None
+
+    def close(self):
+        """Disconnects the extra session opened for parallel fetches."""
+        if self._session is not None:
+            self._session.disconnect()
+            self._session = None
+
+    def _fetch(self):
+        if not self.parallel:
+            self.close()                        # parallel fetches were switched off
+            return (list(self.driver._iter_arp_table()),
+                    list(self.driver._iter_mac_address_table()))
+
+        if self._session is None:
+            self._session = self.driver._new_session()
+
+        mac_table = dict()
+
+        def fetch_mac_table():
+            try:
+                mac_table['entries'] = list(
+                    self.driver._iter_mac_address_table(session=self._session))
+            except Exception as e:
+                mac_table['error'] = e
+
+        thread = threading.Thread(target=fetch_mac_table)
+        thread.start()
+        try:
+            arp_table = list(self.driver._iter_arp_table())
+        finally:
+            thread.join()
+
+        if 'error' in mac_table:
+            raise mac_table['error']
+        return arp_table, mac_table['entries']
+
+    @staticmethod
+    def _apply(index, entries, key, fields=None):
+        """Brings index up to date with entries, key(entry) gives the index key.
+
+        An entry only counts as changed when one of fields (every key by default) differs from
+        the indexed one, the index always keeps the latest entry. Returns the added/changed
+        keys, the removed keys and a dictionary with the previous entry of every replaced or
+        removed key.
+        """
+        seen = set()
+        changed = list()
+        previous = dict()
+        for entry in entries:
+            value = key(entry)
+            seen.add(value)
+            old = index.get(value)
+            index[value] = entry
+            if old is None:
+                changed.append(value)
+            elif (old != entry if fields is None else
+                    any(old[field] != entry[field] for field in fields)):
+                previous[value] = old
+                changed.append(value)
+
+        removed = [value for value in index if value not in seen]
+        for value in removed:
+            previous[value] = index.pop(value)
+        return changed, removed, previous
+
+    def refresh(self):
+        """Fetches both tables and updates the indexes in place.
+
+        Returns a dictionary with the number of added/changed and removed entries per table.
+        """
+        arp_table, mac_table = self._fetch()
+        arp_changed, arp_removed, arp_previous = self._apply(
+            self.by_ip, arp_table, lambda entry: entry['ip'].lower(),
+            ('mac', 'interface'))                  # ages go up on every fetch
+        mac_changed, mac_removed, __ = self._apply(
+            self.by_mac, mac_table, lambda entry: (entry['mac'].lower(), entry['vlan']))
+
+        for mac, vlan in mac_removed:
+            vlans = self.vlans_by_mac[mac]
+            vlans.discard(vlan)
+            if not vlans:
+                del self.vlans_by_mac[mac]
+        for mac, vlan in mac_changed:
+            self.vlans_by_mac.setdefault(mac, set()).add(vlan)
+
+        for ip, old in arp_previous.items():    # drops stale mac -> ip links
+            mac = old['mac'].lower()
+            ips = self.ips_by_mac.get(mac)
+            if ips is not None:
+                ips.discard(ip)
+                if not ips:
+                    del self.ips_by_mac[mac]
+        for ip in arp_changed:
+            self.ips_by_mac.setdefault(self.by_ip[ip]['mac'].lower(), set()).add(ip)
+
+        self.refreshed_at = time.time()
+        return {
+            'arp': {'changed': len(arp_changed), 'removed': len(arp_removed)},
+            'mac': {'changed': len(mac_changed), 'removed': len(mac_removed)},
+        }
+
+    def _location(self, mac, ip=None):
+        learned = [{'interface': self.by_mac[(mac, vlan)]['interface'], 'vlan': vlan}
+                   for vlan in sorted(self.vlans_by_mac.get(mac, ()))]
+        arp_entry = self.by_ip.get(ip) if ip is not None else None
+        if not learned and arp_entry is None:
+            return None
+
+        return {
+            'mac': mac,
+            'ips': sorted(self.ips_by_mac.get(mac, ())),
+            'interface': learned[0]['interface'] if learned else arp_entry['interface'],
+            'vlan': learned[0]['vlan'] if learned else None,
+            'arp_interface': arp_entry['interface'] if arp_entry else None,
+            'learned': learned,
+        }
+
+    def locate(self, ips=(), macs=()):
+        """Looks up a batch of IP and MAC addresses.
+
+        Refreshes the indexes first when they are older than max_age. Returns a dictionary
+        keyed by every queried address with its location, or None when it is not known:
+            * mac (string)
+            * ips (list)
+            * interface (string), port from the MAC table, ARP interface if not learned there
+            * vlan (int), lowest vlan the MAC is learned in
+            * arp_interface (string)
+            * learned (list), interface and vlan of every MAC table entry of the MAC
+        """
+        if self.refreshed_at is None or time.time() - self.refreshed_at >= self.max_age:
+            self.refresh()
+
+        locations = dict()
+        for ip in ips:
+            arp_entry = self.by_ip.get(ip.lower())
+            locations[ip] = (self._location(arp_entry['mac'].lower(), ip.lower())
+                             if arp_entry else None)
+        for mac in macs:
+            mac_key = mac.lower()
+            ips_of_mac = sorted(self.ips_by_mac.get(mac_key, ()))
+            locations[mac] = self._location(mac_key, ips_of_mac[0] if ips_of_mac else None)
+        return locations
+
+
+def locate_hosts(driver, ips=(), macs=(), max_age=60, parallel=False):
+    """Locates IP and MAC addresses behind the ports of driver, see HostLocator.locate().
+
+    The locator is kept on the driver, so later calls reuse and incrementally refresh its
+    indexes instead of rebuilding them.
+    """
+    locator = driver._host_locator
+    if locator is None:
+        locator = driver._host_locator = HostLocator(driver, max_age, parallel)
+    locator.max_age = max_age
+    locator.parallel = parallel
+    return locator.locate(ips, macs)
@@ -0,0 +1,107 @@
+"""Profiling mode, dumps cProfile stats and allocation traces of every getter call.
+
+Enabled with the profile_dir optional argument of the driver. Every call of a getter writes
+into <profile_dir>/<hostname>/:
+    * <getter>.<timestamp>.prof, cProfile stats, open with pstats or snakeviz
+    * <getter>.<timestamp>.alloc.txt, top allocations by line and the traced peak
+
+The allocation snapshot is taken when the getter returns, so the top allocations only show
+memory still held at that point (the result and anything it keeps alive), temporaries freed
+during the call only count towards the peak. Failing to write the files is logged and does not
+change the result or the exception of the getter.
+"""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import cProfile
+import datetime
+import functools
+import io
+import logging
+import os
+import re
+
+try:
+    import tracemalloc
+except ImportError:                                 # python 2, cProfile only
+    tracemalloc = None
+
+
+logger = logging.getLogger(__name__)
+
+TOP_ALLOCATIONS = 25
+PROFILED_METHODS = ('compare_config', 'ping', 'traceroute')
+
+
+def _is_getter(name):
+    return name.startswith('get_') or name in PROFILED_METHODS
+
+
+def _write_allocations(path, snapshot, current, peak):
+    snapshot = snapshot.filter_traces((
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    ))
+    with io.open(path, 'w', encoding='utf-8') as f:
+        f.write('current %d bytes, peak %d bytes\n\n' % (current, peak))
+        for stat in snapshot.statistics('lineno')[:TOP_ALLOCATIONS]:
+            f.write('%s\n' % stat)
+
+
+def _write_profile(directory, name, profiler, allocations):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    stamp = datetime.datetime.now().strftime('%Y%m%d-%H%M%S-%f')
+    base = os.path.join(directory, '%s.%s' % (name, stamp))
+
+    profiler.dump_stats(base + '.prof')
+    if allocations is not None:
+        _write_allocations(base + '.alloc.txt', *allocations)
+
+
+def profile_call(func, directory, name, state):
+    """Wraps func so every call is profiled into directory as <name>.<timestamp>.*
+
+    state is a dict shared by the wrappers of one driver, nested getter calls are not
+    profiled again since cProfile can not run twice at the same time.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if state.get('active'):
+            return func(*args, **kwargs)
+
+        state['active'] = True
+        trace = tracemalloc is not None and not tracemalloc.is_tracing()
+        if trace:
+            tracemalloc.start()
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            state['active'] = False
+            allocations = None
+            if trace:
+                current, peak = tracemalloc.get_traced_memory()
+                allocations = (tracemalloc.take_snapshot(), current, peak)
+                tracemalloc.stop()
+
+            try:
+                _write_profile(directory, name, profiler, allocations)
+            except (IOError, OSError) as e:         # keeps the getter's result or exception
+                logger.warning("could not write the profile of %s into %s: %s",
+                               name, directory, e)
+
+    return wrapper
+
+
+def profile_getters(driver, profile_dir):
+    """Replaces the getters of driver (get_*, ping, traceroute, compare_config) by profiled
+    wrappers writing into profile_dir/<hostname>/.
+    """
+    directory = os.path.join(profile_dir, re.sub(r'[^\w.-]', '_', driver.hostname))
+    state = dict()
+    for name in dir(driver):
+        if _is_getter(name) and callable(getattr(driver, name)):
+            setattr(driver, name, profile_call(getattr(driver, name), directory, name, state))
@@ -0,0 +1,83 @@
+"""Batch ping and traceroute, many destinations run concurrently over extra SSH sessions."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import threading
+
+try:
+    import queue
+except ImportError:                                 # python 2
+    import Queue as queue
+
+
+_DONE = object()                                    # a worker has finished
+
+
+def _run_many(driver, method, destinations, workers, kwargs):
+    """Runs method(destination, session=..., **kwargs) for every destination.
+
+    Each worker opens its own session with driver._new_session() and takes destinations from
+    a shared queue, results are yielded as (destination, result) in completion order.
+    """
+    pending = queue.Queue()
+    for destination in destinations:
+        pending.put(destination)
+    results = queue.Queue()
+    errors = list()
+
+    def worker():
+        try:
+            session = driver._new_session()
+        except Exception as e:
+            errors.append(e)
+            results.put(_DONE)
+            return
+
+        try:
+            while True:
+                try:
+                    destination = pending.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    result = method(destination, session=session, **kwargs)
+                except Exception as e:
+                    result = {'error': str(e)}
+                results.put((destination, result))
+        finally:
+            session.disconnect()
+            results.put(_DONE)
+
+    workers = min(max(workers, 1), pending.qsize())
+    threads = [threading.Thread(target=worker) for __ in range(workers)]
+    for thread in threads:
+        thread.daemon = True                        # do not block exit if the caller stops early
+        thread.start()
+
+    running = len(threads)
+    while running:
+        item = results.get()
+        if item is _DONE:
+            running -= 1
+        else:
+            yield item
+
+    while not pending.empty():                      # every worker failed to connect
+        yield pending.get_nowait(), {'error': 'no session available: %s' % errors[-1]}
+
+
+def ping_many(driver, destinations, workers=4, **kwargs):
+    """Pings every destination from the device, up to workers at a time.
+
+    Yields (destination, result) as each ping finishes, result has the format of
+    FastIronDriver.ping(). Keyword arguments (source, ttl, timeout, size, count, vrf) are
+    passed to every ping.
+    """
+    return _run_many(driver, driver._ping, destinations, workers, kwargs)
+
+
+def traceroute_many(driver, destinations, workers=4, **kwargs):
+    """Same as ping_many() for FastIronDriver.traceroute()."""
+    return _run_many(driver, driver._traceroute, destinations, workers, kwargs)
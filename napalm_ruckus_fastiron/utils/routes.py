@@ -0,0 +1,165 @@
+"""Routing table cache, longest prefix match lookups answered locally from a prefix trie."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import socket
+import time
+
+
+def _address_bits(address):
+    """Returns the address as an integer and its width in bits."""
+    family = socket.AF_INET6 if ':' in address else socket.AF_INET
+    packed = socket.inet_pton(family, address)
+    return int(''.join('%02x' % c for c in bytearray(packed)), 16), len(packed) * 8
+
+
+def _mask(value, length, width):
+    """Returns value with every bit after the first length bits cleared."""
+    return value & (((1 << length) - 1) << (width - length))
+
+
+def _common_length(a, b, width, limit):
+    """Returns the number of leading bits a and b share, at most limit."""
+    differ = a ^ b
+    return limit if not differ else min(limit, width - differ.bit_length())
+
+
+class _Node(object):
+    """Path compressed trie node, holds the first length bits of value.
+
+    Chains of single child nodes are collapsed, a node only exists where a prefix is stored
+    or where two prefixes branch off, so the bits skipped from its parent are implicit in
+    value and length.
+    """
+
+    __slots__ = ('value', 'length', 'zero', 'one', 'prefix', 'routes')
+
+    def __init__(self, value, length):
+        self.value = value
+        self.length = length
+        self.zero = None
+        self.one = None
+        self.prefix = None
+        self.routes = None
+
+    def child(self, bit):
+        return self.one if bit else self.zero
+
+    def set_child(self, bit, node):
+        if bit:
+            self.one = node
+        else:
+            self.zero = node
+
+
+class PrefixTrie(object):
+    """Path compressed binary trie (radix tree) of IPv4 and IPv6 prefixes."""
+
+    def __init__(self):
+        self._roots = {32: _Node(0, 0), 128: _Node(0, 0)}
+        self.size = 0                               # number of prefixes stored
+
+    def _insert(self, value, length, width):
+        """Returns the node holding the first length bits of value, creating it if needed."""
+        node = self._roots[width]
+        while node.length < length:
+            bit = (value >> (width - 1 - node.length)) & 1
+            child = node.child(bit)
+            if child is None:
+                child = _Node(value, length)
+                node.set_child(bit, child)
+                return child
+
+            common = _common_length(child.value, value, width, min(child.length, length))
+            if common == child.length:
+                node = child
+                continue
+
+            # value leaves the path of child before its end, split the skipped bits
+            branch = _Node(_mask(value, common, width), common)
+            branch.set_child((child.value >> (width - 1 - common)) & 1, child)
+            node.set_child(bit, branch)
+            if common == length:
+                return branch
+            leaf = _Node(value, length)
+            branch.set_child((value >> (width - 1 - common)) & 1, leaf)
+            return leaf
+        return node
+
+    def add(self, prefix, route):
+        """Appends route to the routes of prefix, e.g. '10.0.0.0/8'."""
+        network, length = prefix.split('/')
+        value, width = _address_bits(network)
+        length = int(length)
+
+        node = self._insert(_mask(value, length, width), length, width)
+        if node.routes is None:
+            node.prefix = prefix
+            node.routes = list()
+            self.size += 1
+        node.routes.append(route)
+
+    def lookup(self, address):
+        """Returns (prefix, routes) of the longest prefix matching address, or None."""
+        value, width = _address_bits(address)
+        node = self._roots[width]
+        best = None
+
+        while node is not None and _mask(value, node.length, width) == node.value:
+            if node.routes is not None:
+                best = node
+            if node.length == width:
+                break
+            node = node.child((value >> (width - 1 - node.length)) & 1)
+
+        return (best.prefix, best.routes) if best is not None else None
+
+
+class RouteTable(object):
+    """Routing table of a FastIron driver, downloaded once and kept in a PrefixTrie.
+
+    The full table is fetched with a single show ip route, parsed line by line straight into
+    the trie, and fetched again on the first lookup after refresh_interval seconds.
+    """
+
+    def __init__(self, driver, refresh_interval=300, protocol=""):
+        self.driver = driver
+        self.refresh_interval = refresh_interval
+        self.protocol = protocol
+        self.refreshed_at = None
+        self.trie = PrefixTrie()
+
+    def refresh(self):
+        """Downloads the routing table and replaces the trie, returns the number of prefixes."""
+        trie = PrefixTrie()
+        for prefix, route in self.driver._iter_routes(protocol=self.protocol):
+            trie.add(prefix, route)
+
+        self.trie = trie                            # swapped once fully built
+        self.refreshed_at = time.time()
+        return trie.size
+
+    def _refresh_if_stale(self):
+        if (self.refreshed_at is None or
+                time.time() - self.refreshed_at >= self.refresh_interval):
+            self.refresh()
+
+    def lookup(self, address):
+        """Returns the longest prefix match for address in get_route_to() format.
+
+        The result is {prefix: [routes]}, empty when no route covers the address.
+        """
+        self._refresh_if_stale()
+        match = self.trie.lookup(address)
+        return {match[0]: match[1]} if match is not None else {}
+
+    def lookup_many(self, addresses):
+        """Returns {address: lookup(address)} for every address, with at most one refresh."""
+        self._refresh_if_stale()
+        results = dict()
+        for address in addresses:
+            match = self.trie.lookup(address)
+            results[address] = {match[0]: match[1]} if match is not None else {}
+        return results
@@ -0,0 +1,113 @@
+"""Result sinks, write getter records to disk one at a time instead of as a single list."""
+
+# Python3 support
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import json
+
+
+def stream_getter(driver, getter, sink, args=(), kwargs=None, **extra):
+    """Runs a getter and writes its records into sink as they are parsed.
+
+    args and kwargs are passed to the getter (e.g. kwargs={'interface': '1/1/1'}), keys in
+    extra are added to every record.
+
+    Getters with an iterator variant on the driver (``_iter_<name>`` for ``get_<name>``) are
+    streamed entry by entry, any other list returning getter is written once it returns and
+    a dictionary returning getter (get_facts, get_optics...) is written as a single record.
+    Returns the number of records written.
+    """
+    iterator = getattr(driver, '_iter_' + getter[len('get_'):], None)
+    kwargs = kwargs or dict()
+    records = (iterator or getattr(driver, getter))(*args, **kwargs)
+    if isinstance(records, dict):
+        records = [records]
+    return sink.write_from(records, **extra)
+
+
+class ResultSink(object):
+    """Base class for incremental result writers.
+
+    Subclasses implement ``_open`` and ``_encode``. A sink can be used as a context manager:
+
+        with JSONLinesSink('arp.jsonl') as sink:
+            for driver in drivers:
+                stream_getter(driver, 'get_arp_table', sink, device=driver.hostname)
+    """
+
+    def __init__(self, path, append=False):
+        self.path = path
+        self.append = append
+        self.count = 0                              # records written so far
+        self._file = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open(self):
+        return io.open(self.path, 'ab' if self.append else 'wb')
+
+    def _encode(self, record):
+        raise NotImplementedError
+
+    def open(self):
+        """Opens the backing file, called implicitly by the first write."""
+        if self._file is None:
+            self._file = self._open()
+
+    def close(self):
+        """Flushes and closes the backing file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def write(self, record, **extra):
+        """Writes a single record, keys in extra (e.g. device=hostname) are added to it."""
+        if extra:
+            record = dict(record, **extra)
+        self.open()
+        self._file.write(self._encode(record))
+        self.count += 1
+
+    def write_from(self, records, **extra):
+        """Writes every record of an iterable as it is produced, returns the number written."""
+        written = 0
+        for record in records:
+            self.write(record, **extra)
+            written += 1
+        return written
+
+
+class JSONLinesSink(ResultSink):
+    """Writes one JSON document per line."""
+
+    def _encode(self, record):
+        return (json.dumps(record, sort_keys=True) + '\n').encode('utf-8')
+
+
+class MsgpackSink(ResultSink):
+    """Writes a stream of msgpack maps, readable with ``msgpack.Unpacker``.
+
+    Requires the optional ``msgpack`` package.
+    """
+
+    def __init__(self, path, append=False):
+        super(MsgpackSink, self).__init__(path, append)
+        self._packer = None
+
+    def _open(self):
+        try:
+            import msgpack
+        except ImportError:
+            raise ImportError("MsgpackSink requires the msgpack package: pip install msgpack")
+        self._packer = msgpack.Packer(use_bin_type=True)
+        return super(MsgpackSink, self)._open()
+
+    def _encode(self, record):
+        return self._packer.pack(record)
@@ -1,5 +1,6 @@
 """Test fixtures."""
 from builtins import super
+import threading
 
 import pytest
 from napalm.base.test import conftest as parent_conftest
@@ -22,6 +23,29 @@ def set_device_parameters(request):
     parent_conftest.set_device_parameters(request)
 
 
+@pytest.fixture
+def fake_driver():
+    """Factory of FastIronDrivers wired to FakeFastIronSessions instead of SSH.
+
+    fake_driver(outputs) maps commands to outputs, the None key answers any other command and
+    outputs may be callables taking the command. Extra sessions opened through _new_session
+    share the outputs and are kept in driver.sessions.
+    """
+    def factory(outputs, hostname='sw1', optional_args=None):
+        driver = FastIron.FastIronDriver(hostname, 'admin', 'pwd', optional_args=optional_args)
+        driver.device = FakeFastIronSession(outputs)
+        driver.sessions = list()
+        lock = threading.Lock()
+
+        def new_session():
+            with lock:
+                driver.sessions.append(FakeFastIronSession(outputs))
+                return driver.sessions[-1]
+        driver._new_session = new_session
+        return driver
+    return factory
+
+
 def pytest_generate_tests(metafunc):
     """Generate test cases dynamically."""
     parent_conftest.pytest_generate_tests(metafunc, __file__)
@@ -56,3 +80,22 @@ class FakeFastIronDevice(BaseTestDouble):
         full_path = self.find_file(filename)
         result = self.read_txt_file(full_path)
         return py23_compat.text_type(result)
+
+
+class FakeFastIronSession(object):
+    """FastIron SSH session test double answering from a dict, records the commands sent."""
+
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.sent = list()
+        self.sent_kwargs = list()
+        self.connected = True
+
+    def send_command(self, command, **kwargs):
+        self.sent.append(command)
+        self.sent_kwargs.append(kwargs)
+        output = self.outputs[command] if command in self.outputs else self.outputs[None]
+        return output(command) if callable(output) else output
+
+    def disconnect(self):
+        self.connected = False
@@ -0,0 +1,97 @@
+"""Tests for the cached compare_config."""
+
+import pytest
+
+from napalm_ruckus_fastiron import parsers
+
+
+RUNNING = """Current configuration:
+!
+ver 08.0.30
+!
+hostname sw1
+!
+vlan 10 name users by port
+ tagged ethe 1/1/1
+!
+interface ethernet 1/1/1
+ port-name uplink
+!
+end
+"""
+
+CANDIDATE = RUNNING.replace(' port-name uplink', ' port-name core')
+
+
+@pytest.fixture
+def counting_driver(fake_driver, monkeypatch):
+    """Builds fake drivers answering the running config, returns (driver, config_diff calls)."""
+    diffs = list()
+    config_diff = parsers.config_diff
+
+    def counting_diff(*args):
+        diffs.append(args)
+        return config_diff(*args)
+    monkeypatch.setattr(parsers, 'config_diff', counting_diff)
+
+    def factory(optional_args=None, running=RUNNING):
+        return fake_driver({'show running-config': running}, optional_args=optional_args), diffs
+    return factory
+
+
+def test_repeated_compare_reuses_diff(counting_driver):
+    driver, diffs = counting_driver()
+    driver.load_replace_candidate(config=CANDIDATE)
+
+    first = driver.compare_config()
+    assert '-  port-name uplink' in first and '+  port-name core' in first
+    assert driver.compare_config() == first
+    assert len(diffs) == 1
+    assert len(driver.device.sent) == 2                 # running config is still checked
+
+    driver.load_replace_candidate(config=RUNNING)
+    assert driver.compare_config() == ''
+    assert len(diffs) == 2
+
+
+def test_replace_reports_one_line_blocks(counting_driver):
+    driver, diffs = counting_driver()
+    driver.load_replace_candidate(config=RUNNING.replace('hostname sw1', 'hostname sw2'))
+
+    assert driver.compare_config() == '+ hostname sw2\n- hostname sw1\n'
+
+
+def test_merge_candidate_without_separators(counting_driver):
+    driver, diffs = counting_driver()
+    driver.load_merge_candidate(config="hostname sw9\n")
+    assert driver.compare_config() == '+ hostname sw9\n'
+
+    driver.load_merge_candidate(config="hostname sw1\ninterface ethernet 1/1/1\n port-name core\n")
+    assert driver.compare_config() == 'interface ethernet 1/1/1\n+  port-name core\n'
+
+
+def test_configs_without_trailing_newline(counting_driver):
+    driver, diffs = counting_driver(running=RUNNING.rstrip('\n'))     # as netmiko returns it
+    driver.load_replace_candidate(config=RUNNING.rstrip('\n'))
+    assert driver.compare_config() == ''
+
+    driver.discard_config()
+    driver.load_merge_candidate(config="hostname sw9")
+    assert driver.compare_config() == '+ hostname sw9\n'
+
+
+def test_running_config_ttl_and_discard(counting_driver):
+    driver, diffs = counting_driver({'running_config_ttl': 3600})
+    driver.load_merge_candidate(config=CANDIDATE)
+
+    driver.compare_config()
+    driver.compare_config()
+    assert len(driver.device.sent) == 1
+
+    driver.discard_config()
+    assert driver.compare_config() == ''
+    assert driver._compare_cache == {}
+
+    driver.load_merge_candidate(config=CANDIDATE)
+    driver.compare_config()
+    assert len(driver.device.sent) == 2 and len(diffs) == 2
@@ -0,0 +1,90 @@
+"""Tests for the host locator."""
+
+from napalm_ruckus_fastiron.utils.hosts import HostLocator, locate_hosts
+
+
+SHOW_ARP = """All ARPs: 2, maximum capacity: 4096
+No.   IP              MAC            Type     Age Port           Status VLAN
+1     10.0.0.1        cc4e.2491.5c00 Dynamic  0   1/1/1          Valid  10
+2     10.0.0.2        000c.2968.ea15 Dynamic  3   1/1/2          Valid  20
+"""
+
+SHOW_MAC = """Total active entries from all ports = 2
+  MAC-Address    Port     Type   VLAN	Action
+cc4e.2491.5c00   1/1/1  Dynamic     10	forward
+000c.2968.ea15   1/1/7  Dynamic     20	forward
+"""
+
+OUTPUTS = {'show arp': SHOW_ARP, 'show mac-address all': SHOW_MAC}
+
+
+def test_locate_ips_and_macs(fake_driver):
+    driver = fake_driver(dict(OUTPUTS))
+    locations = locate_hosts(driver, ips=['10.0.0.2', '10.9.9.9'], macs=['CC4E.2491.5C00'])
+
+    assert locations['10.0.0.2'] == {'mac': '000c.2968.ea15', 'ips': ['10.0.0.2'],
+                                     'interface': '1/1/7', 'vlan': 20, 'arp_interface': '1/1/2',
+                                     'learned': [{'interface': '1/1/7', 'vlan': 20}]}
+    assert locations['CC4E.2491.5C00']['ips'] == ['10.0.0.1']
+    assert locations['CC4E.2491.5C00']['interface'] == '1/1/1'
+    assert locations['10.9.9.9'] is None
+
+
+def test_index_is_reused_and_refreshed_incrementally(fake_driver):
+    driver = fake_driver(dict(OUTPUTS))
+    locate_hosts(driver, ips=['10.0.0.1'])
+    locate_hosts(driver, ips=['10.0.0.2'])
+    assert len(driver.device.sent) == 2                 # second call served from the index
+
+    locator = driver._host_locator
+    driver.device.outputs['show arp'] = SHOW_ARP.replace('cc4e.2491.5c00', '000c.2968.ea15')
+    assert locator.refresh() == {'arp': {'changed': 1, 'removed': 0},
+                                 'mac': {'changed': 0, 'removed': 0}}
+    assert locator.ips_by_mac == {'000c.2968.ea15': {'10.0.0.1', '10.0.0.2'}}
+
+
+def test_ageing_arp_entries_are_not_changes(fake_driver):
+    driver = fake_driver(dict(OUTPUTS))
+    locator = driver._host_locator = HostLocator(driver)
+    locator.refresh()
+    ips_by_mac = dict(locator.ips_by_mac)
+
+    driver.device.outputs['show arp'] = SHOW_ARP.replace('  0   1/1/1', ' 42   1/1/1')
+    assert locator.refresh()['arp'] == {'changed': 0, 'removed': 0}
+    assert locator.by_ip['10.0.0.1']['age'] == 42.0
+    assert locator.ips_by_mac == ips_by_mac
+
+
+def test_parallel_fetch_uses_extra_session(fake_driver):
+    driver = fake_driver(dict(OUTPUTS))
+
+    locator = HostLocator(driver, parallel=True)
+    assert locator.locate(macs=['000c.2968.ea15'])['000c.2968.ea15']['interface'] == '1/1/7'
+    assert driver.device.sent == ['show arp']
+    assert driver.sessions[0].sent == ['show mac-address all']
+
+
+def test_extra_session_is_closed(fake_driver):
+    driver = fake_driver(dict(OUTPUTS))
+    locate_hosts(driver, ips=['10.0.0.1'], max_age=0, parallel=True)
+    locate_hosts(driver, ips=['10.0.0.1'], max_age=0, parallel=False)
+    assert not driver.sessions[0].connected
+
+    locate_hosts(driver, ips=['10.0.0.1'], max_age=0, parallel=True)
+    driver.close()
+    assert not driver.sessions[1].connected and not driver.device.connected
+
+
+def test_mac_learned_in_several_vlans(fake_driver):
+    outputs = dict(OUTPUTS)
+    outputs['show mac-address all'] = SHOW_MAC + 'cc4e.2491.5c00   1/1/9  Dynamic     30\tforward\n'
+    driver = fake_driver(outputs)
+
+    location = locate_hosts(driver, macs=['cc4e.2491.5c00'])['cc4e.2491.5c00']
+    assert location['learned'] == [{'interface': '1/1/1', 'vlan': 10},
+                                   {'interface': '1/1/9', 'vlan': 30}]
+    assert driver._host_locator.refresh()['mac'] == {'changed': 0, 'removed': 0}
+
+    outputs['show mac-address all'] = SHOW_MAC
+    assert driver._host_locator.refresh()['mac'] == {'changed': 0, 'removed': 1}
+    assert driver._host_locator.vlans_by_mac['cc4e.2491.5c00'] == {10}
@@ -0,0 +1,50 @@
+"""Tests for package import time and offline parsing without the SSH stack."""
+
+import os
+import subprocess
+import sys
+
+
+IMPORT_BUDGET = 0.1                 # seconds allowed to import the parsers and parse an output
+HEAVY_MODULES = ('netmiko', 'paramiko', 'napalm', 'pkg_resources')
+SHOW_ARP = os.path.join(os.path.dirname(__file__), 'mocked_data', 'test_get_arp_table',
+                        'normal', 'show_arp.text')
+
+PARSE_SCRIPT = """
+import sys
+import time
+start = time.time()
+from napalm_ruckus_fastiron import parsers
+with open(%r) as f:
+    entries = list(parsers.arp_table(f.read()))
+print(time.time() - start)
+print(len(entries))
+print(','.join(m for m in %r if m in sys.modules))
+""" % (SHOW_ARP, HEAVY_MODULES)
+
+
+def _parse_in_fresh_interpreter():
+    output = subprocess.check_output([sys.executable, '-c', PARSE_SCRIPT])
+    elapsed, entries, loaded = output.decode().splitlines()
+    return float(elapsed), int(entries), [m for m in loaded.split(',') if m]
+
+
+class TestImportTime(object):
+    """Offline parsing must not pull in napalm or the SSH stack."""
+
+    def test_parsing_does_not_load_ssh_stack(self):
+        __, entries, loaded = _parse_in_fresh_interpreter()
+        assert entries == 6
+        assert loaded == []
+
+    def test_parsing_within_budget(self):
+        best = min(_parse_in_fresh_interpreter()[0] for __ in range(3))
+        assert best < IMPORT_BUDGET, "import and parse took %.3fs, budget %.3fs" % (
+            best, IMPORT_BUDGET)
+
+    def test_driver_resolves_on_first_access(self):
+        import napalm_ruckus_fastiron
+        from napalm_ruckus_fastiron.FastIron import FastIronDriver
+
+        assert napalm_ruckus_fastiron.FastIronDriver is FastIronDriver
+        assert 'FastIronDriver' in dir(napalm_ruckus_fastiron)
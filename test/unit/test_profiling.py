@@ -0,0 +1,52 @@
+"""Tests for the profiling mode."""
+
+import os
+import pstats
+
+import pytest
+
+from napalm_ruckus_fastiron import FastIron
+
+
+SHOW_ARP = """No.   IP              MAC            Type     Age Port           Status VLAN
+1     10.176.217.3    cc4e.2491.5c00 Dynamic  0   mgmt1          Valid  1
+"""
+
+
+def test_getter_calls_are_profiled(fake_driver, tmpdir):
+    driver = fake_driver({'show arp': SHOW_ARP}, hostname='10.0.0.1',
+                         optional_args={'profile_dir': str(tmpdir)})
+
+    assert driver.get_arp_table()[0]['ip'] == '10.176.217.3'
+    driver.get_arp_table()
+
+    directory = os.path.join(str(tmpdir), '10.0.0.1')
+    files = sorted(os.listdir(directory))
+    assert len([f for f in files if f.endswith('.prof')]) == 2
+    assert len([f for f in files if f.endswith('.alloc.txt')]) == 2
+
+    stats = pstats.Stats(os.path.join(directory, files[-1]))
+    assert any(func[2] == 'arp_table' for func in stats.stats)
+    with open(os.path.join(directory, files[0])) as f:
+        assert f.readline().startswith('current')
+
+
+def test_profiling_is_off_by_default(tmpdir):
+    driver = FastIron.FastIronDriver('10.0.0.1', 'admin', 'pwd')
+    assert 'get_arp_table' not in vars(driver)
+
+
+def test_profile_write_errors_keep_the_getter_outcome(fake_driver, tmpdir, caplog):
+    not_a_directory = tmpdir.join('profiles')
+    not_a_directory.write('')
+    driver = fake_driver({'show arp': SHOW_ARP}, hostname='10.0.0.1',
+                         optional_args={'profile_dir': str(not_a_directory)})
+
+    assert driver.get_arp_table()[0]['ip'] == '10.176.217.3'
+    assert 'could not write the profile of get_arp_table' in caplog.text
+
+    def failing_command(command):
+        raise ValueError('bad output')
+    driver.device.outputs['show arp'] = failing_command
+    with pytest.raises(ValueError):
+        driver.get_arp_table()
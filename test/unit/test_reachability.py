@@ -0,0 +1,67 @@
+"""Tests for batch ping and traceroute."""
+
+from napalm_ruckus_fastiron.utils.reachability import ping_many, traceroute_many
+
+
+PING = """Sending 2, 100-byte ICMP Echo to {0}, timeout 2000 msec, TTL 255
+Reply from {0}       : bytes=100 time=3ms TTL=60
+Reply from {0}       : bytes=100 time<1ms TTL=60
+Success rate is 100 percent (2/2), round-trip min/avg/max=1/2/3 ms.
+"""
+
+TRACEROUTE = """Tracing the route to IP node {0} from 1 to 255 hops
+
+  1     2 ms    1 ms    2 ms  {0}
+IP: Trace route complete.
+"""
+
+
+def _answer(command):
+    """Answers ping and traceroute for any destination."""
+    destination = command.split()[1]
+    if destination == 'bad.example':
+        return 'Error - Unknown host bad.example'
+    return (PING if command.startswith('ping') else TRACEROUTE).format(destination)
+
+
+def test_ping_many_runs_on_extra_sessions(fake_driver):
+    driver = fake_driver({None: _answer})
+    destinations = ['10.0.0.%d' % i for i in range(1, 11)] + ['bad.example']
+    results = dict(ping_many(driver, destinations, workers=3, count=2))
+
+    assert sorted(results) == sorted(destinations)
+    assert results['10.0.0.4']['success']['probes_sent'] == 2
+    assert results['10.0.0.4']['success']['rtt_max'] == 3.0
+    assert 'error' in results['bad.example']
+    assert len(driver.sessions) == 3
+    assert sum(len(s.sent) for s in driver.sessions) == len(destinations)
+    assert not any(s.connected for s in driver.sessions)
+    assert driver.device.sent == []
+
+
+def test_traceroute_many(fake_driver):
+    driver = fake_driver({None: _answer})
+    results = dict(traceroute_many(driver, ['10.0.0.1', '10.0.0.2'], workers=4))
+    assert results['10.0.0.2']['success'][1]['probes'][1]['ip_address'] == '10.0.0.2'
+
+
+def test_all_sessions_failing_reports_every_destination(fake_driver):
+    driver = fake_driver({None: _answer})
+
+    def new_session():
+        raise IOError('connection refused')
+    driver._new_session = new_session
+
+    results = dict(ping_many(driver, ['10.0.0.1', '10.0.0.2']))
+    assert sorted(results) == ['10.0.0.1', '10.0.0.2']
+    assert 'connection refused' in results['10.0.0.1']['error']
+
+
+def test_long_commands_wait_for_their_timeouts(fake_driver):
+    driver = fake_driver({None: _answer})
+    driver.ping('10.0.0.1', count=2, timeout=2)
+    driver.traceroute('10.0.0.1')
+    dict(traceroute_many(driver, ['10.0.0.2'], ttl=10, timeout=3))
+
+    assert driver.device.sent_kwargs == [{'max_loops': 170}, {'max_loops': 2700}]
+    assert driver.sessions[0].sent_kwargs == [{'max_loops': 300}]
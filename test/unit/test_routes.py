@@ -0,0 +1,67 @@
+"""Tests for the routing table cache."""
+
+from napalm_ruckus_fastiron.utils.routes import PrefixTrie, RouteTable
+
+
+SHOW_IP_ROUTE = """Total number of IP routes: 4
+Type Codes - B:BGP D:Connected I:ISIS O:OSPF R:RIP S:Static; Cost - Dist/Metric
+        Destination        Gateway         Port          Cost          Type Uptime src-vrf
+1       0.0.0.0/0          10.0.0.1        ve 10         1/1           S    12d2h   -
+2       10.0.0.0/24        DIRECT          ve 10         0/0           D    12d2h   -
+3       10.1.0.0/16        10.0.0.2        e 1/1/1       110/2         O    1h3m    -
+4       10.1.2.0           255.255.255.0   10.0.0.3      e 1/1/2       20/0  Be  5m10s   -
+"""
+
+
+def test_trie_longest_prefix_match():
+    trie = PrefixTrie()
+    trie.add('10.0.0.0/8', 'a')
+    trie.add('10.1.0.0/16', 'b')
+    trie.add('2001:db8::/32', 'c')
+
+    assert trie.lookup('10.1.2.3') == ('10.1.0.0/16', ['b'])
+    assert trie.lookup('10.2.0.1') == ('10.0.0.0/8', ['a'])
+    assert trie.lookup('2001:db8::1') == ('2001:db8::/32', ['c'])
+    assert trie.lookup('192.168.0.1') is None
+    assert trie.size == 3
+
+
+def test_trie_splits_compressed_paths():
+    trie = PrefixTrie()
+    trie.add('10.1.2.0/24', 'c')                    # a single node below the root
+    trie.add('10.1.3.0/24', 'd')                    # branches off in the middle of its path
+    trie.add('10.1.0.0/16', 'b')                    # lands on the branch node
+    trie.add('10.0.0.0/8', 'a')                     # splits the path above it
+    trie.add('0.0.0.0/0', 'default')
+    trie.add('10.1.2.7/32', 'host')
+
+    assert trie.lookup('10.1.2.7') == ('10.1.2.7/32', ['host'])
+    assert trie.lookup('10.1.2.8') == ('10.1.2.0/24', ['c'])
+    assert trie.lookup('10.1.3.1') == ('10.1.3.0/24', ['d'])
+    assert trie.lookup('10.1.4.1') == ('10.1.0.0/16', ['b'])
+    assert trie.lookup('10.9.0.1') == ('10.0.0.0/8', ['a'])
+    assert trie.lookup('11.0.0.1') == ('0.0.0.0/0', ['default'])
+    assert trie.size == 6
+
+
+def test_route_table_answers_lookups_locally(fake_driver):
+    driver = fake_driver({'show ip route': SHOW_IP_ROUTE})
+    table = RouteTable(driver, refresh_interval=3600)
+
+    results = table.lookup_many(['10.1.2.3', '10.1.9.9', '10.0.0.7', '8.8.8.8'])
+    assert list(results['10.1.2.3']) == ['10.1.2.0/24']
+    assert results['10.1.2.3']['10.1.2.0/24'][0]['protocol'] == 'bgp'
+    assert results['10.1.9.9']['10.1.0.0/16'][0]['age'] == 3780
+    assert results['10.0.0.7']['10.0.0.0/24'][0]['next_hop'] == ''
+    assert results['8.8.8.8']['0.0.0.0/0'][0]['outgoing_interface'] == 've10'
+    assert table.lookup('10.1.2.3') == results['10.1.2.3']
+    assert driver.device.sent == ['show ip route']
+
+
+def test_route_table_refreshes_after_interval(fake_driver):
+    driver = fake_driver({'show ip route': SHOW_IP_ROUTE})
+    table = RouteTable(driver, refresh_interval=0)
+
+    table.lookup('10.1.2.3')
+    table.lookup('10.1.2.3')
+    assert len(driver.device.sent) == 2
@@ -0,0 +1,88 @@
+"""Tests for the result sinks."""
+
+import json
+
+import pytest
+
+from napalm_ruckus_fastiron.utils.sinks import JSONLinesSink, MsgpackSink, stream_getter
+
+
+RECORDS = [
+    {'interface': 'mgmt1', 'mac': 'cc4e.2491.5c00', 'ip': '10.176.217.3', 'age': 0.0},
+    {'interface': 'mgmt1', 'mac': '000c.2968.ea15', 'ip': '10.176.217.140', 'age': 9.0},
+]
+
+
+SHOW_ARP = """No.   IP              MAC            Type     Age Port           Status VLAN
+1     10.176.217.3    cc4e.2491.5c00 Dynamic  0   mgmt1          Valid  1
+2     10.176.217.140  000c.2968.ea15 Dynamic  9   mgmt1          Valid  1
+"""
+SHOW_OPTIC = "1/2/1   32.5390 C  -002.3210 dBm -002.8794 dBm    6.156 mA\n"
+SHOW_LLDP = "".join("""Local port: {0}
+  Neighbor: 748e.f8a4.6a80, TTL 101 seconds
+    + Port ID (interface name): {0}
+""".format(port) for port in ('1/1/1', '1/1/5'))
+
+
+def test_jsonl_sink_writes_one_record_per_line(tmpdir):
+    path = str(tmpdir.join('arp.jsonl'))
+    with JSONLinesSink(path) as sink:
+        written = sink.write_from(RECORDS, device='sw1')
+
+    with open(path) as f:
+        lines = [json.loads(line) for line in f]
+    assert written == sink.count == 2
+    assert lines == [dict(r, device='sw1') for r in RECORDS]
+
+
+def test_jsonl_sink_append(tmpdir):
+    path = str(tmpdir.join('arp.jsonl'))
+    for __ in range(2):
+        with JSONLinesSink(path, append=True) as sink:
+            sink.write(RECORDS[0])
+
+    with open(path) as f:
+        assert len(f.readlines()) == 2
+
+
+def test_msgpack_sink_round_trip(tmpdir):
+    msgpack = pytest.importorskip('msgpack')
+    path = str(tmpdir.join('arp.msgpack'))
+    with MsgpackSink(path) as sink:
+        sink.write_from(RECORDS)
+
+    with open(path, 'rb') as f:
+        assert list(msgpack.Unpacker(f, raw=False)) == RECORDS
+
+
+def test_stream_getter_prefers_iterator_variant(tmpdir, fake_driver):
+    driver = fake_driver({'show arp': SHOW_ARP})
+    path = str(tmpdir.join('arp.jsonl'))
+    with JSONLinesSink(path) as sink:
+        assert stream_getter(driver, 'get_arp_table', sink, device=driver.hostname) == 2
+
+    with open(path) as f:
+        assert [json.loads(line) for line in f] == [dict(r, device='sw1') for r in RECORDS]
+
+
+def test_stream_getter_writes_dict_result_as_one_record(tmpdir, fake_driver):
+    driver = fake_driver({'show optic all': SHOW_OPTIC})
+    path = str(tmpdir.join('optics.jsonl'))
+    with JSONLinesSink(path) as sink:
+        assert stream_getter(driver, 'get_optics', sink, device=driver.hostname) == 1
+
+    with open(path) as f:
+        record = json.loads(f.read())
+    assert record['device'] == 'sw1'
+    assert record['1/2/1']['physical_channels']['channel'][0]['index'] == 0
+
+
+def test_stream_getter_passes_getter_arguments(tmpdir, fake_driver):
+    driver = fake_driver({'show lldp neighbors detail': SHOW_LLDP})
+    path = str(tmpdir.join('lldp.jsonl'))
+    with JSONLinesSink(path) as sink:
+        stream_getter(driver, 'get_lldp_neighbors_detail', sink,
+                      kwargs={'interface': '1/1/5'}, device=driver.hostname)
+
+    with open(path) as f:
+        assert sorted(json.loads(f.read())) == ['1/1/5', 'device']
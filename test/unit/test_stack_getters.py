@@ -0,0 +1,45 @@
+"""Tests for the stack wide optics and LLDP getters."""
+
+from napalm_ruckus_fastiron import parsers
+
+
+OPTIC = "{0}   32.5390 C  -002.3210 dBm -002.8794 dBm    6.156 mA\n        Normal      Normal\n"
+LLDP = """Local port: {0}
+  Neighbor: 748e.f8a4.6a80, TTL 101 seconds
+    + Chassis ID (MAC address): 748e.f8a4.6a80
+    + Port ID (interface name): {0}
+    + System name         : "core-1"
+"""
+
+
+def _driver(fake_driver, units):
+    """Stack of units x 48 ports."""
+    ports = ['%d/1/%d' % (unit, port) for unit in range(1, units + 1) for port in range(1, 49)]
+
+    def answer(command):
+        template = OPTIC if command.startswith('show optic') else LLDP
+        return ''.join(template.format(port) for port in ports)
+    return fake_driver({None: answer}, hostname='stack1'), ports
+
+
+def test_round_trips_do_not_grow_with_ports(fake_driver):
+    for units in (1, 8):
+        driver, ports = _driver(fake_driver, units)
+        assert len(driver.get_optics()) == 48 * units
+        assert len(driver.get_lldp_neighbors_detail()) == 48 * units
+        assert len(driver.get_lldp_neighbors_detail(interface='1/1/5')) == 1
+        assert len(driver.device.sent) == 3
+
+
+def test_interface_names_are_shared(fake_driver):
+    driver, ports = _driver(fake_driver, 1)
+    optics = driver.get_optics()
+    lldp = driver.get_lldp_neighbors_detail()
+    brief = ''.join('%s  Up  Forward  Full 1G  None  No  1  0  748e.f8a4.6a80\n' % port
+                    for port in ports)
+    facts = parsers.facts_interface_list(brief)
+
+    port = facts[4]
+    assert port == '1/1/5'
+    assert [p for p in optics if p == port][0] is port
+    assert [p for p in lldp if p == port][0] is port